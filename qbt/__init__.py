@@ -5,6 +5,11 @@ Quantitative Backtesting (QBT) - A Python library for backtesting trading strate
 __version__ = "0.1.0"
 __author__ = "QBT Development Team"
 
+# Library logging convention: qbt loggers stay silent unless the
+# application configures handlers/levels itself
+import logging as _logging
+_logging.getLogger(__name__).addHandler(_logging.NullHandler())
+
 from .engine.backtester import Backtester
 from .engine.state import PortfolioState
 from .engine.metrics import PerformanceMetrics
@@ -0,0 +1,689 @@
+"""Numba-accelerated numeric kernels for the backtesting engine.
+
+Numba is an optional dependency (install with ``pip install qbt[perf]``).
+When it is not available the kernels fall back to plain Python/NumPy, so
+everything keeps working — just without the JIT speedup.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange, types
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op replacement for numba.njit when numba is not installed."""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrapper(func):
+            return func
+        return wrapper
+
+if NUMBA_AVAILABLE:
+    # Signatures for the kernels that consume caller-supplied matrices.
+    # Under pandas 3 copy-on-write, to_numpy() hands out zero-copy
+    # read-only views, which the 'f8[:,:]' string shorthand rejects at
+    # dispatch; spelling the input as readonly=True accepts both those
+    # views and ordinary writable arrays (the kernels never write their
+    # inputs anyway).
+    _f8_2d = types.Array(types.float64, 2, 'A')
+    _f8_2d_ro = types.Array(types.float64, 2, 'A', readonly=True)
+    _EWMA_SIG = _f8_2d(_f8_2d_ro, types.float64)
+    _MACD_SIG = types.UniTuple(_f8_2d, 3)(
+        _f8_2d_ro, types.float64, types.float64, types.float64
+    )
+    _RSI_SIG = _f8_2d(_f8_2d_ro, types.int64)
+else:
+    _EWMA_SIG = _MACD_SIG = _RSI_SIG = None
+
+
+# Explicit signatures force eager compilation once at import time; together
+# with cache=True the compiled machine code survives on disk, so repeated
+# backtester invocations (e.g. parameter sweeps) skip JIT entirely.
+@njit(
+    'f8[:](f8[:,:], i8[:], f8[:,:], f8[:])',
+    cache=True, fastmath=True, error_model='numpy'
+)
+def compute_equity_curve(
+    close: np.ndarray,
+    row_idx: np.ndarray,
+    qty_hist: np.ndarray,
+    cash: np.ndarray
+) -> np.ndarray:
+    """Compute per-bar total equity in one fused loop.
+
+    Args:
+        close: (n_dates, n_symbols) NaN-zeroed close price matrix
+        row_idx: (n_bars,) row of `close` corresponding to each recorded bar
+        qty_hist: (n_bars, n_symbols) holdings at the end of each bar
+        cash: (n_bars,) cash balance at the end of each bar
+
+    Returns:
+        (n_bars,) array of total equity per bar
+    """
+    n_bars, n_symbols = qty_hist.shape
+    equity = np.empty(n_bars, dtype=np.float64)
+    for i in range(n_bars):
+        total = cash[i]
+        row = close[row_idx[i]]
+        for j in range(n_symbols):
+            total += qty_hist[i, j] * row[j]
+        equity[i] = total
+    return equity
+
+
+@njit(cache=True)
+def max_drawdown_duration(ts_days: np.ndarray, drawdown: np.ndarray) -> int:
+    """Find the longest drawdown run in calendar days with one scan.
+
+    A run lasts from its first below-peak bar to the first recovery bar
+    (clamped to the last bar when the curve ends under water). A curve
+    that never recovers at all returns -1 so the caller can report the
+    legacy full-bar-count instead.
+
+    Args:
+        ts_days: (n_bars,) bar timestamps as int64 days since epoch
+        drawdown: (n_bars,) drawdown series (0 at peaks, negative below)
+
+    Returns:
+        Longest run length in days, 0 without any drawdown, -1 when the
+        only run never recovers
+    """
+    n = drawdown.shape[0]
+    best = 0
+    start_day = 0
+    in_drawdown = False
+    n_runs = 0
+    had_recovery = False
+    for i in range(n):
+        below = drawdown[i] < 0.0
+        if below and not in_drawdown:
+            in_drawdown = True
+            n_runs += 1
+            start_day = ts_days[i]
+        elif not below and in_drawdown:
+            in_drawdown = False
+            had_recovery = True
+            run_days = ts_days[i] - start_day
+            if run_days > best:
+                best = run_days
+    if in_drawdown:
+        if n_runs == 1 and not had_recovery:
+            return -1
+        run_days = ts_days[n - 1] - start_day
+        if run_days > best:
+            best = run_days
+    return best
+
+
+@njit(cache=True)
+def equity_stats(equity: np.ndarray):
+    """Compute the per-curve performance statistics in one fused pass.
+
+    Walks the equity curve once, producing everything calculate_metrics
+    previously derived from separate pandas passes (pct_change, expanding
+    max, drawdown, min/max): daily returns, the drawdown series, the
+    maximum drawdown, return sum and sum of squares (for the standard
+    deviation), and best/worst daily return.
+
+    Args:
+        equity: (n_bars,) equity curve
+
+    Returns:
+        Tuple of (returns, drawdown, max_drawdown, sum_r, sum_r2,
+        best_day, worst_day)
+    """
+    n = equity.shape[0]
+    returns = np.empty(max(n - 1, 0), dtype=np.float64)
+    drawdown = np.empty(n, dtype=np.float64)
+    running_max = equity[0] if n else 0.0
+    max_drawdown = 0.0
+    sum_r = 0.0
+    sum_r2 = 0.0
+    best_day = -np.inf
+    worst_day = np.inf
+    for i in range(n):
+        value = equity[i]
+        if value > running_max:
+            running_max = value
+        dd = (value - running_max) / running_max
+        drawdown[i] = dd
+        if dd < max_drawdown:
+            max_drawdown = dd
+        if i > 0:
+            r = value / equity[i - 1] - 1.0
+            returns[i - 1] = r
+            sum_r += r
+            sum_r2 += r * r
+            if r > best_day:
+                best_day = r
+            if r < worst_day:
+                worst_day = r
+    return returns, drawdown, max_drawdown, sum_r, sum_r2, best_day, worst_day
+
+
+@njit(cache=True)
+def drawdown_pct(equity: np.ndarray) -> np.ndarray:
+    """Compute the percentage drawdown series in a single scan.
+
+    Args:
+        equity: (n_bars,) equity curve
+
+    Returns:
+        (n_bars,) drawdown from the running peak, in percent (<= 0)
+    """
+    n = equity.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    peak = equity[0] if n else 0.0
+    for i in range(n):
+        value = equity[i]
+        if value > peak:
+            peak = value
+        out[i] = (value - peak) / peak * 100.0
+    return out
+
+
+@njit(cache=True)
+def rolling_sharpe(
+    returns: np.ndarray, window: int, annualization: float
+) -> np.ndarray:
+    """Compute a rolling Sharpe ratio with a sliding sum/sum-of-squares.
+
+    Matches pandas rolling(window).mean() / rolling(window).std() (sample
+    std, ddof=1) scaled by ``annualization``; windows with zero variance
+    yield NaN like the pandas division would.
+
+    Args:
+        returns: (n,) daily returns
+        window: window length in bars
+        annualization: scale factor (e.g. sqrt(252))
+
+    Returns:
+        (n - window + 1,) Sharpe per complete window
+    """
+    n = returns.shape[0]
+    m = n - window + 1
+    out = np.empty(max(m, 0), dtype=np.float64)
+    sum_r = 0.0
+    sum_r2 = 0.0
+    for i in range(n):
+        r = returns[i]
+        sum_r += r
+        sum_r2 += r * r
+        if i >= window:
+            old = returns[i - window]
+            sum_r -= old
+            sum_r2 -= old * old
+        if i >= window - 1:
+            mean = sum_r / window
+            var = (sum_r2 - sum_r * sum_r / window) / (window - 1)
+            if var > 0.0:
+                out[i - window + 1] = mean / np.sqrt(var) * annualization
+            else:
+                out[i - window + 1] = np.nan
+    return out
+
+
+@njit(_EWMA_SIG, cache=True, parallel=True)
+def ewma(values: np.ndarray, alpha: float) -> np.ndarray:
+    """Exponentially weighted mean of each column.
+
+    Replicates pandas ``ewm(alpha=...).mean()`` with ``adjust=True`` and
+    ``ignore_na=True`` (the engine's settings), including its exact
+    weighted-average update, so signals computed here are bit-identical
+    to the pandas path. NaN rows carry the previous mean forward without
+    decaying the accumulated weight; leading NaNs stay NaN.
+
+    Args:
+        values: (n_dates, n_symbols) float64 matrix (NaN = no data)
+        alpha: smoothing factor, e.g. 2 / (span + 1)
+
+    Returns:
+        (n_dates, n_symbols) matrix of running exponential means
+    """
+    n, m = values.shape
+    out = np.empty((n, m), dtype=np.float64)
+    old_wt_factor = 1.0 - alpha
+    for j in prange(m):
+        weighted_avg = np.nan
+        old_wt = 1.0
+        for i in range(n):
+            cur = values[i, j]
+            if cur == cur:
+                if weighted_avg == weighted_avg:
+                    old_wt *= old_wt_factor
+                    if weighted_avg != cur:
+                        weighted_avg = (
+                            (old_wt * weighted_avg + cur) / (old_wt + 1.0)
+                        )
+                    old_wt += 1.0
+                else:
+                    weighted_avg = cur
+            out[i, j] = weighted_avg
+    return out
+
+
+@njit(_MACD_SIG, cache=True, parallel=True)
+def macd(
+    values: np.ndarray,
+    alpha_fast: float,
+    alpha_slow: float,
+    alpha_signal: float
+):
+    """MACD line, signal line and histogram of each column in one pass.
+
+    Fuses the three EWM recurrences (fast, slow, and the signal line
+    over their difference) into a single streaming loop per column, so
+    the price matrix is read once instead of being swept per span with
+    intermediate buffers in between. Each state follows the exact
+    weighted-average update of the ewma kernel, so the outputs are
+    bit-identical to calling it three times.
+
+    Args:
+        values: (n_dates, n_symbols) float64 price matrix (NaN = no data)
+        alpha_fast: smoothing factor of the fast EMA, 2 / (span + 1)
+        alpha_slow: smoothing factor of the slow EMA
+        alpha_signal: smoothing factor of the signal line
+
+    Returns:
+        Tuple of (macd_line, signal_line, histogram) matrices
+    """
+    n, m = values.shape
+    out_macd = np.empty((n, m), dtype=np.float64)
+    out_signal = np.empty((n, m), dtype=np.float64)
+    out_hist = np.empty((n, m), dtype=np.float64)
+    fast_factor = 1.0 - alpha_fast
+    slow_factor = 1.0 - alpha_slow
+    signal_factor = 1.0 - alpha_signal
+    for j in prange(m):
+        fast_avg = np.nan
+        fast_wt = 1.0
+        slow_avg = np.nan
+        slow_wt = 1.0
+        signal_avg = np.nan
+        signal_wt = 1.0
+        for i in range(n):
+            cur = values[i, j]
+            if cur == cur:
+                if fast_avg == fast_avg:
+                    fast_wt *= fast_factor
+                    if fast_avg != cur:
+                        fast_avg = (fast_wt * fast_avg + cur) / (fast_wt + 1.0)
+                    fast_wt += 1.0
+                    slow_wt *= slow_factor
+                    if slow_avg != cur:
+                        slow_avg = (slow_wt * slow_avg + cur) / (slow_wt + 1.0)
+                    slow_wt += 1.0
+                else:
+                    fast_avg = cur
+                    slow_avg = cur
+            macd_val = fast_avg - slow_avg
+            out_macd[i, j] = macd_val
+            # The signal line smooths the MACD line itself, including
+            # carried-forward values on no-data rows, matching the
+            # unfused ewma(macd_line) pass
+            if macd_val == macd_val:
+                if signal_avg == signal_avg:
+                    signal_wt *= signal_factor
+                    if signal_avg != macd_val:
+                        signal_avg = (
+                            (signal_wt * signal_avg + macd_val)
+                            / (signal_wt + 1.0)
+                        )
+                    signal_wt += 1.0
+                else:
+                    signal_avg = macd_val
+            out_signal[i, j] = signal_avg
+            out_hist[i, j] = macd_val - signal_avg
+    return out_macd, out_signal, out_hist
+
+
+@njit(_RSI_SIG, cache=True, error_model='numpy', parallel=True)
+def wilder_rsi(values: np.ndarray, period: int) -> np.ndarray:
+    """Relative Strength Index of each column with Wilder's smoothing.
+
+    Canonical RSI: average gain/loss are seeded with the simple mean of
+    the first ``period`` price changes, then updated recursively as
+    ``avg = ((period - 1) * avg + current) / period`` — an EWM with
+    alpha = 1/period. Everything runs in one fused pass per column
+    (delta, branchless gain/loss split, smoothing, RSI), replacing two
+    rolling-mean sweeps plus the ratio arithmetic. NaN rows are skipped
+    without resetting the smoothing state (deltas bridge gaps between
+    valid observations) and produce NaN output, matching the ignore_na
+    convention of the ewma kernel.
+
+    Args:
+        values: (n_dates, n_symbols) float64 price matrix (NaN = no data)
+        period: smoothing period (Wilder's classic choice is 14)
+
+    Returns:
+        (n_dates, n_symbols) RSI matrix in [0, 100]; NaN until the seed
+        window is filled
+    """
+    n, m = values.shape
+    out = np.full((n, m), np.nan)
+    for j in prange(m):
+        prev = np.nan
+        avg_gain = 0.0
+        avg_loss = 0.0
+        sum_gain = 0.0
+        sum_loss = 0.0
+        count = 0
+        for i in range(n):
+            cur = values[i, j]
+            if cur != cur:
+                continue
+            if prev == prev:
+                delta = cur - prev
+                gain = delta if delta > 0.0 else 0.0
+                loss = -delta if delta < 0.0 else 0.0
+                if count < period:
+                    sum_gain += gain
+                    sum_loss += loss
+                    count += 1
+                    if count == period:
+                        avg_gain = sum_gain / period
+                        avg_loss = sum_loss / period
+                        out[i, j] = 100.0 - 100.0 / (
+                            1.0 + avg_gain / avg_loss
+                        )
+                else:
+                    avg_gain = ((period - 1) * avg_gain + gain) / period
+                    avg_loss = ((period - 1) * avg_loss + loss) / period
+                    out[i, j] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+            prev = cur
+    return out
+
+
+# Typed lazily (no explicit signature): the price row arrives as a
+# read-only NumPy view, which eager signature strings cannot express
+@njit(cache=True)
+def crossover_decisions(
+    changed_idx: np.ndarray,
+    prev_sig: np.ndarray,
+    curr_sig: np.ndarray,
+    prices: np.ndarray,
+    positions: np.ndarray,
+    cash: float,
+    total_equity: float,
+    position_size: float
+):
+    """Run CrossOverStrategy's order decisions for one bar in compiled code.
+
+    For each symbol whose signal changed, applies the crossover rules
+    (enter long on 0 -> 1 when flat or short, exit on 1 -> 0 when long)
+    and sizes the entry as a fraction of total equity, truncated to
+    whole shares and rejected when the target value exceeds cash. The
+    Python caller only builds Order objects for the nonzero results.
+
+    Args:
+        changed_idx: indices (into the symbol order) with changed signals
+        prev_sig: (n_symbols,) previous signal vector (int8)
+        curr_sig: (n_symbols,) current signal vector (int8)
+        prices: (n_symbols,) close prices for the bar (NaN = no data)
+        positions: (n_symbols,) current share counts
+        cash: available cash
+        total_equity: portfolio equity marked at the bar's prices
+        position_size: fraction of equity per entry
+
+    Returns:
+        Tuple of (close_qty, trade_qty, valid), one entry per changed
+        index: a short-covering quantity, the entry/exit quantity, and
+        whether the symbol had a usable price (invalid entries must not
+        have their previous signal advanced)
+    """
+    n = changed_idx.shape[0]
+    close_qty = np.zeros(n, dtype=np.int64)
+    trade_qty = np.zeros(n, dtype=np.int64)
+    valid = np.empty(n, dtype=np.bool_)
+    for k in range(n):
+        j = changed_idx[k]
+        price = prices[j]
+        if not price > 0.0:
+            valid[k] = False
+            continue
+        valid[k] = True
+        current_signal = curr_sig[j]
+        previous_signal = prev_sig[j]
+        position = positions[j]
+        if current_signal == 1 and previous_signal == 0:
+            if position <= 0.0:  # not currently long
+                if position < 0.0:  # close any short first
+                    close_qty[k] = int(-position)
+                position_value = total_equity * position_size
+                shares_to_buy = int(position_value / price)
+                if shares_to_buy > 0 and position_value <= cash:
+                    trade_qty[k] = shares_to_buy
+        elif current_signal == 0 and previous_signal == 1:
+            if position > 0.0:  # currently long
+                trade_qty[k] = int(-position)
+    return close_qty, trade_qty, valid
+
+
+@njit(cache=True)
+def execute_orders(
+    qty: np.ndarray,
+    price: np.ndarray,
+    sym_idx: np.ndarray,
+    positions: np.ndarray,
+    cash: float,
+    commission: float,
+    slippage_rate: float,
+    filled: np.ndarray,
+    fill_qty: np.ndarray,
+    fill_price: np.ndarray,
+    fill_fees: np.ndarray,
+    fill_slip: np.ndarray
+) -> float:
+    """Run SimpleBroker's per-order fill reconciliation in compiled code.
+
+    Replays the buy cash check (with size clipping), the sell
+    position clamp and the cash/position bookkeeping for one bar's worth
+    of orders. The loop is sequential by design: every accepted fill
+    changes the cash and positions seen by the next order. Results are
+    written into caller-provided output arrays so the broker can reuse
+    scratch buffers across bars.
+
+    Args:
+        qty: (n,) order quantities (positive buys, negative sells)
+        price: (n,) market price per order (<= 0 means skip)
+        sym_idx: (n,) integer symbol index per order
+        positions: (n_symbols,) current position per symbol index; updated
+            in place as fills are accepted
+        cash: available cash
+        commission: commission rate (fraction of trade value)
+        slippage_rate: slippage rate (fraction of price)
+        filled: (n,) output; marks accepted orders
+        fill_qty: (n,) output; executed quantity (valid where filled)
+        fill_price: (n,) output; execution price (valid where filled)
+        fill_fees: (n,) output; fees paid (valid where filled)
+        fill_slip: (n,) output; total slippage cost (valid where filled)
+
+    Returns:
+        Cash remaining after all accepted fills
+    """
+    n = qty.shape[0]
+    # Slippage is adverse: buys pay up, sells receive less. Folding it
+    # into one multiplier per side keeps the loop to a single multiply,
+    # and the execution price then already carries the full slippage cost
+    buy_mult = 1.0 + slippage_rate
+    sell_mult = 1.0 - slippage_rate
+    fee_mult = 1.0 + commission
+    for i in range(n):
+        filled[i] = False
+        p = price[i]
+        if p <= 0.0:
+            continue
+
+        q = qty[i]
+        exec_price = p * (buy_mult if q > 0 else sell_mult)
+        trade_value = abs(q) * exec_price
+        fees = trade_value * commission
+
+        if q > 0:
+            # trade_value is charged at the slipped price, so slippage is
+            # already paid there; only fees come on top
+            total_cost = trade_value + fees
+            if total_cost > cash:
+                # Clip the buy to what the available cash can carry
+                max_shares = int(cash / (exec_price * fee_mult))
+                if max_shares <= 0:
+                    continue
+                q = float(max_shares)
+                trade_value = q * exec_price
+                fees = trade_value * commission
+        elif q < 0:
+            # Can't sell what we don't have; note trade_value/fees keep
+            # the pre-clamp values, matching the historical cash math
+            max_sell = -positions[sym_idx[i]]
+            if q < max_sell:
+                q = max_sell
+            if q >= 0:
+                continue
+
+        # Slippage cost per fill, reported for analysis but not charged
+        # again: it is embedded in exec_price
+        slip_cost = abs(q) * p * slippage_rate
+        if q > 0:
+            cash -= trade_value + fees
+        else:
+            cash += trade_value - fees
+        positions[sym_idx[i]] += q
+
+        filled[i] = True
+        fill_qty[i] = q
+        fill_price[i] = exec_price
+        fill_fees[i] = fees
+        fill_slip[i] = slip_cost
+
+    return cash
+
+
+# No fastmath here: the kernel relies on NaN self-comparison to skip symbols
+# without data on a given date.
+@njit(cache=True)
+def simulate_weight_targets(
+    close: np.ndarray,
+    weights: np.ndarray,
+    initial_cash: float,
+    commission: float,
+    slippage_rate: float
+):
+    """Run the whole backtest accounting sweep for weight-target strategies.
+
+    Replays SimpleBroker's fill semantics (slippage, fees, cash-limited buys,
+    position-limited sells) day by day in compiled code, targeting
+    ``floor(weight * equity / price)`` shares per symbol.
+
+    Args:
+        close: (n_days, n_symbols) close price matrix (NaN = no data)
+        weights: (n_days, n_symbols) desired portfolio weights (NaN = 0)
+        initial_cash: starting cash
+        commission: commission rate (fraction of trade value)
+        slippage_rate: slippage rate (fraction of price)
+
+    Returns:
+        Tuple of (cash_out, equity_out, qty_out, n_trades, trade_day,
+        trade_sym, trade_qty, trade_price, trade_fees, trade_slip)
+    """
+    n_days, n_symbols = close.shape
+    cash = initial_cash
+    qty = np.zeros(n_symbols, dtype=np.float64)
+
+    # Same per-side slippage multipliers as execute_orders: the execution
+    # price carries the whole slippage cost, nothing is charged twice
+    buy_mult = 1.0 + slippage_rate
+    sell_mult = 1.0 - slippage_rate
+    fee_mult = 1.0 + commission
+
+    cash_out = np.empty(n_days, dtype=np.float64)
+    equity_out = np.empty(n_days, dtype=np.float64)
+    qty_out = np.empty((n_days, n_symbols), dtype=np.float64)
+
+    max_trades = n_days * n_symbols
+    trade_day = np.empty(max_trades, dtype=np.int64)
+    trade_sym = np.empty(max_trades, dtype=np.int64)
+    trade_qty = np.empty(max_trades, dtype=np.float64)
+    trade_price = np.empty(max_trades, dtype=np.float64)
+    trade_fees = np.empty(max_trades, dtype=np.float64)
+    trade_slip = np.empty(max_trades, dtype=np.float64)
+    n_trades = 0
+
+    for i in range(n_days):
+        # Mark the book to market before trading
+        equity = cash
+        for j in range(n_symbols):
+            price = close[i, j]
+            if price == price:
+                equity += qty[j] * price
+
+        for j in range(n_symbols):
+            price = close[i, j]
+            if price != price or price <= 0.0:
+                continue
+            weight = weights[i, j]
+            if weight != weight:
+                weight = 0.0
+
+            target = int(weight * equity / price)
+            delta = target - int(qty[j])
+            if delta == 0:
+                continue
+
+            exec_price = price * (buy_mult if delta > 0 else sell_mult)
+            abs_delta = abs(delta)
+            trade_value = abs_delta * exec_price
+            fees = trade_value * commission
+
+            if delta > 0:
+                total_cost = trade_value + fees
+                if total_cost > cash:
+                    max_shares = int(cash / (exec_price * fee_mult))
+                    if max_shares <= 0:
+                        continue
+                    delta = max_shares
+                    abs_delta = delta
+                    trade_value = abs_delta * exec_price
+                    fees = trade_value * commission
+            else:
+                # Can't sell more than we hold
+                if -delta > qty[j]:
+                    delta = -int(qty[j])
+                    if delta >= 0:
+                        continue
+                    abs_delta = -delta
+                    trade_value = abs_delta * exec_price
+                    fees = trade_value * commission
+
+            # Reported, not charged again: embedded in exec_price
+            slip_cost = abs_delta * price * slippage_rate
+            if delta > 0:
+                cash -= trade_value + fees
+            else:
+                cash += trade_value - fees
+            qty[j] += delta
+
+            trade_day[n_trades] = i
+            trade_sym[n_trades] = j
+            trade_qty[n_trades] = delta
+            trade_price[n_trades] = exec_price
+            trade_fees[n_trades] = fees
+            trade_slip[n_trades] = slip_cost
+            n_trades += 1
+
+        # Mark again after fills for the recorded curve
+        equity = cash
+        for j in range(n_symbols):
+            price = close[i, j]
+            if price == price:
+                equity += qty[j] * price
+        cash_out[i] = cash
+        equity_out[i] = equity
+        qty_out[i] = qty
+
+    return (cash_out, equity_out, qty_out, n_trades,
+            trade_day, trade_sym, trade_qty, trade_price,
+            trade_fees, trade_slip)
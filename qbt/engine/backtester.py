@@ -1,20 +1,216 @@
-from typing import List, Dict, Any, Optional
+import logging
+from typing import Callable, List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
 from ..data.base import DataSource
 from ..signals.base import SignalGenerator
 from ..strategy.base import Strategy
 from ..execution.base import Broker
-from .state import PortfolioState, Fill
+from .state import BarView, PortfolioState, PriceRowView, Fill
+from ._kernels import compute_equity_curve, simulate_weight_targets
+
+# Optional progress bar: amortized updates keep it off the hot path
+try:
+    from tqdm.auto import tqdm
+except ImportError:
+    tqdm = None
+
+# Debug/diagnostic chatter goes through a level-gated logger (silent by
+# default); user-facing run summaries stay on stdout
+logger = logging.getLogger(__name__)
+
+
+def _fast_unstack(series: pd.Series) -> pd.DataFrame:
+    """Unstack a [Date, Symbol]-indexed series to a (dates x symbols) frame.
+
+    When the index is the full date/symbol product in lexsorted order, this
+    is a plain zero-copy reshape; pandas' general unstack machinery is only
+    used as the fallback for ragged data.
+    """
+    index = series.index
+    dates = index.get_level_values('Date').unique()
+    symbols = index.get_level_values('Symbol').unique()
+    if (len(series) == len(dates) * len(symbols)
+            and index.is_monotonic_increasing):
+        values = series.to_numpy().reshape(len(dates), len(symbols))
+        return pd.DataFrame(values, index=dates, columns=symbols)
+    return series.unstack('Symbol')
+
+
+def _empty_curve(n_bars: int) -> Dict[str, Any]:
+    """Allocate one SoA equity-curve record (see BacktestResult._bench_curves)."""
+    return {
+        'dates': np.empty(n_bars, dtype='datetime64[ns]'),
+        'cash': np.empty(n_bars, dtype=np.float64),
+        'equity': np.empty(n_bars, dtype=np.float64),
+        'positions': np.empty(n_bars, dtype=np.int32),
+        'n': 0,
+    }
+
+
+def _record_curve_point(curve: Dict[str, Any], date, cash: float,
+                        equity: float, positions: int):
+    """Write one point into an SoA equity-curve record."""
+    i = curve['n']
+    curve['dates'][i] = np.datetime64(date)
+    curve['cash'][i] = cash
+    curve['equity'][i] = equity
+    curve['positions'][i] = positions
+    curve['n'] = i + 1
+
+
+def _run_benchmark_walk(
+    strategy: Strategy,
+    broker: Broker,
+    prices_df: pd.DataFrame,
+    initial_cash: float,
+    mirror_legacy: bool = False
+):
+    """Simulate one benchmark strategy over the full price stream.
+
+    Benchmarks are independent of the primary strategy given the same
+    prices, so this is a self-contained function that runs after the main
+    loop (or concurrently in a worker process). When mirror_legacy is True
+    the legacy benchmark bookkeeping is replayed in the same walk, calling
+    on_bar a second time per bar on the same strategy object exactly as the
+    old serial loop did.
+
+    Returns:
+        Tuple of (curve, trades, final_equity, legacy_curve, legacy_trades,
+        legacy_final_equity, errors) where the curves are SoA records as
+        built by _empty_curve.
+    """
+    state = PortfolioState(cash=initial_cash)
+    legacy_state = PortfolioState(cash=initial_cash) if mirror_legacy else None
+    trades: List[Fill] = []
+    legacy_trades: List[Fill] = []
+    errors: List[Tuple[datetime, str]] = []
+
+    date_level = prices_df.index.get_level_values('Date')
+    if not date_level.is_monotonic_increasing:
+        prices_df = prices_df.sort_index(level='Date', sort_remaining=False)
+    daily_groups = prices_df.groupby(level='Date', sort=False)
+    n_days = daily_groups.ngroups
+    curve = _empty_curve(n_days)
+    legacy_curve = _empty_curve(n_days) if mirror_legacy else None
+
+    pos_matrix = None
+    if 'Close' in prices_df.columns:
+        close_wide = _fast_unstack(prices_df['Close'])
+        close_arr = close_wide.to_numpy()
+        close_symbols = close_wide.columns.tolist()
+        close_filled = np.nan_to_num(close_arr).astype(np.float64, copy=False)
+        state.bind_symbols(close_symbols)
+        if legacy_state is not None:
+            legacy_state.bind_symbols(close_symbols)
+        # Both walk states share one positions matrix (qty_vecs become row
+        # views), so per-bar equity is a single matrix-vector product
+        walk_states = [state] if legacy_state is None else [state, legacy_state]
+        pos_matrix = np.zeros((len(walk_states), len(close_symbols)),
+                              dtype=np.float64)
+        for k, walk_state in enumerate(walk_states):
+            pos_matrix[k, :] = walk_state.qty_vec
+            walk_state.qty_vec = pos_matrix[k]
+        # Zero-copy per-bar prices: rebinding the view's row replaces
+        # rebuilding a dict over the whole universe on trading bars
+        price_view = PriceRowView(state.symbol_index)
+    else:
+        close_arr = None
+        close_symbols = []
+        close_filled = None
+
+    for i, (date, symbol_data) in enumerate(daily_groups):
+        try:
+            symbol_data = symbol_data.droplevel('Date')
+            if symbol_data.empty:
+                continue
+
+            # The price dict is only needed to execute orders, so bars
+            # without any (the common case for buy-and-hold benchmarks)
+            # skip building it entirely
+            current_prices = None
+
+            orders = strategy.on_bar(date, symbol_data, state)
+            if orders:
+                if close_arr is not None:
+                    price_view.row = close_arr[i]
+                    current_prices = price_view
+                else:
+                    current_prices = {}
+                trades.extend(broker.execute(orders, current_prices, state, date))
+
+            if legacy_state is not None:
+                legacy_orders = strategy.on_bar(date, symbol_data, legacy_state)
+                if legacy_orders:
+                    if current_prices is None:
+                        if close_arr is not None:
+                            price_view.row = close_arr[i]
+                            current_prices = price_view
+                        else:
+                            current_prices = {}
+                    legacy_trades.extend(broker.execute(
+                        legacy_orders, current_prices, legacy_state, date))
+
+            if close_filled is not None:
+                values = pos_matrix @ close_filled[i]
+                equity = state.cash + values[0]
+            else:
+                # No Close column: no prices to mark against
+                values = None
+                equity = state.cash
+            _record_curve_point(curve, date, state.cash, equity,
+                                len(state.positions))
+
+            if legacy_state is not None:
+                if values is not None:
+                    legacy_equity = legacy_state.cash + values[1]
+                else:
+                    legacy_equity = legacy_state.cash
+                _record_curve_point(legacy_curve, date, legacy_state.cash,
+                                    legacy_equity, len(legacy_state.positions))
+        except Exception as e:
+            errors.append((date, str(e)))
+
+    final_equity = (float(curve['equity'][curve['n'] - 1])
+                    if curve['n'] else initial_cash)
+    legacy_final = initial_cash
+    if legacy_curve is not None and legacy_curve['n']:
+        legacy_final = float(legacy_curve['equity'][legacy_curve['n'] - 1])
+    return (curve, trades, final_equity,
+            legacy_curve, legacy_trades, legacy_final, errors)
+
+
+# SoA layout for executed trades: cache-friendly for vectorized reporting
+# and avoids holding one Python object per fill
+TRADE_DTYPE = np.dtype([
+    ('date', 'datetime64[ns]'),
+    ('symbol_id', 'i4'),
+    ('qty', 'f8'),
+    ('price', 'f8'),
+    ('fees', 'f8'),
+    ('slippage', 'f8'),
+])
 
 
 class BacktestResult:
     """Container for backtest results."""
-    
+
     def __init__(self):
-        self.equity_curve: List[Dict[str, Any]] = []
-        self.trades: List[Fill] = []
-        self.portfolio_history: List[Dict[str, Any]] = []
+        # Trade storage: structured array grown with doubling capacity;
+        # the Fill-object list API is materialized lazily via the property
+        self._trades_arr: np.ndarray = np.empty(0, dtype=TRADE_DTYPE)
+        self._n_trades: int = 0
+        self._trade_symbols: List[str] = []
+        self._trade_symbol_ids: Dict[str, int] = {}
+        self._trades_cache: Optional[List[Fill]] = None
+        # Append-only log of (date, symbol, qty_delta, cash_delta) per fill;
+        # portfolio_history is reconstructed from it lazily instead of
+        # snapshotting the whole portfolio state every bar
+        self.state_log: List[tuple] = []
+        self._portfolio_history_cache: Optional[List[Dict[str, Any]]] = None
+        # Per-bar errors collected during the run as (date, message)
+        self.errors: List[Tuple[datetime, str]] = []
         self.start_date: Optional[datetime] = None
         self.end_date: Optional[datetime] = None
         self.initial_cash: float = 0.0
@@ -29,62 +225,323 @@ class BacktestResult:
         self.config: Dict[str, Any] = {}
         # Market data with signals
         self.market_data: Optional[pd.DataFrame] = None
-        
+        # Equity curve storage: preallocated parallel arrays written per bar,
+        # materialized to list-of-dicts only on demand via the property below
+        self._equity_dates: Optional[np.ndarray] = None
+        self._equity_cash: Optional[np.ndarray] = None
+        self._equity_vals: Optional[np.ndarray] = None
+        self._equity_pos: Optional[np.ndarray] = None
+        self._n_recorded: int = 0
+        self._equity_curve_cache: Optional[List[Dict[str, Any]]] = None
+        # DataFrame views of the curves, cached per curve name; consumers
+        # (metrics, viz, summary) treat them as read-only, and
+        # calculate_all_benchmark_metrics rebuilds them once per benchmark
+        # otherwise
+        self._df_cache: Dict[str, pd.DataFrame] = {}
+        # Benchmark curves recorded in the same SoA layout, keyed by
+        # benchmark name ('__legacy__' for the legacy single benchmark) and
+        # materialized to the public list-of-dicts form once after the run
+        self._bench_curves: Dict[str, Dict[str, Any]] = {}
+
+    def preallocate(self, n_bars: int):
+        """Preallocate equity-curve arrays for up to n_bars recordings."""
+        self._equity_dates = np.empty(n_bars, dtype='datetime64[ns]')
+        self._equity_cash = np.empty(n_bars, dtype=np.float64)
+        self._equity_vals = np.empty(n_bars, dtype=np.float64)
+        self._equity_pos = np.empty(n_bars, dtype=np.int32)
+        self._n_recorded = 0
+        self._equity_curve_cache = None
+        self._df_cache.clear()
+
+    def record_equity_point(self, date, cash: float, equity: float, positions: int):
+        """Write one equity-curve point into the preallocated arrays."""
+        i = self._n_recorded
+        self._equity_dates[i] = np.datetime64(date)
+        self._equity_cash[i] = cash
+        self._equity_vals[i] = equity
+        self._equity_pos[i] = positions
+        self._n_recorded = i + 1
+        self._equity_curve_cache = None
+
+    def preallocate_benchmark(self, name: str, n_bars: int):
+        """Preallocate equity-curve arrays for one benchmark."""
+        self._bench_curves[name] = _empty_curve(n_bars)
+
+    def record_benchmark_point(self, name: str, date, cash: float,
+                               equity: float, positions: int):
+        """Write one benchmark equity-curve point into its arrays."""
+        curve = self._bench_curves[name]
+        i = curve['n']
+        curve['dates'][i] = np.datetime64(date)
+        curve['cash'][i] = cash
+        curve['equity'][i] = equity
+        curve['positions'][i] = positions
+        curve['n'] = i + 1
+
+    def materialize_benchmark_curves(self):
+        """Convert recorded benchmark arrays to the public list-of-dicts form."""
+        for name, curve in self._bench_curves.items():
+            n = curve['n']
+            if name == '__legacy__':
+                target = self.benchmark_equity_curve
+            else:
+                if name not in self.benchmarks:
+                    self.benchmarks[name] = {
+                        'equity_curve': [], 'trades': [], 'final_equity': 0.0
+                    }
+                target = self.benchmarks[name]['equity_curve']
+            dates = pd.DatetimeIndex(curve['dates'][:n])
+            target.extend(
+                {'Date': date, 'Cash': cash, 'Equity': equity,
+                 'Positions': int(pos)}
+                for date, cash, equity, pos in zip(
+                    dates, curve['cash'][:n], curve['equity'][:n],
+                    curve['positions'][:n]
+                )
+            )
+
+    def _ensure_trade_capacity(self, extra: int):
+        """Grow the trade array (doubling) to fit extra more rows."""
+        needed = self._n_trades + extra
+        capacity = len(self._trades_arr)
+        if needed > capacity:
+            new_capacity = max(64, capacity * 2)
+            while new_capacity < needed:
+                new_capacity *= 2
+            new_arr = np.empty(new_capacity, dtype=TRADE_DTYPE)
+            new_arr[:self._n_trades] = self._trades_arr[:self._n_trades]
+            self._trades_arr = new_arr
+
+    def record_fills(self, date, fills: List[Fill]):
+        """Append executed strategy fills to the trade array and delta log."""
+        self._ensure_trade_capacity(len(fills))
+        date64 = np.datetime64(date)
+        for fill in fills:
+            symbol_id = self._trade_symbol_ids.get(fill.symbol)
+            if symbol_id is None:
+                symbol_id = len(self._trade_symbols)
+                self._trade_symbol_ids[fill.symbol] = symbol_id
+                self._trade_symbols.append(fill.symbol)
+            self._trades_arr[self._n_trades] = (
+                date64, symbol_id, fill.quantity,
+                fill.price, fill.fees, fill.slippage
+            )
+            self._n_trades += 1
+            self.record_fill_delta(date, fill)
+        self._trades_cache = None
+
+    @property
+    def trades_array(self) -> np.ndarray:
+        """Executed trades as a structured array (see TRADE_DTYPE).
+
+        Preferred over the trades list for vectorized consumers: derived
+        quantities like total cost are NumPy expressions over its columns,
+        e.g. ``np.abs(a['qty']) * a['price'] + a['fees']``.
+        """
+        return self._trades_arr[:self._n_trades]
+
+    @property
+    def trade_symbols(self) -> List[str]:
+        """Symbol table mapping trades_array['symbol_id'] to tickers."""
+        return self._trade_symbols
+
+    @property
+    def trades(self) -> List[Fill]:
+        """Executed trades as Fill objects (materialized lazily)."""
+        if self._trades_cache is None:
+            arr = self._trades_arr[:self._n_trades]
+            timestamps = pd.DatetimeIndex(arr['date'])
+            self._trades_cache = [
+                Fill(
+                    symbol=self._trade_symbols[row['symbol_id']],
+                    quantity=int(row['qty']),
+                    price=float(row['price']),
+                    fees=float(row['fees']),
+                    slippage=float(row['slippage']),
+                    timestamp=timestamp
+                )
+                for row, timestamp in zip(arr, timestamps)
+            ]
+        return self._trades_cache
+
+    def record_fill_delta(self, date, fill: Fill):
+        """Log the cash/position deltas of a strategy fill."""
+        # Mirrors SimpleBroker's cash accounting: fill.price is the
+        # execution price and already carries the slippage cost
+        cash_delta = -(fill.quantity * fill.price) - fill.fees
+        self.state_log.append((date, fill.symbol, fill.quantity, cash_delta))
+        self._portfolio_history_cache = None
+
+    def state_at(self, date) -> 'PortfolioState':
+        """Reconstruct the portfolio state as of a given date from the log."""
+        state = PortfolioState(cash=self.initial_cash)
+        cutoff = pd.Timestamp(date)
+        for log_date, symbol, qty_delta, cash_delta in self.state_log:
+            if pd.Timestamp(log_date) > cutoff:
+                break  # log is chronological
+            state.cash += cash_delta
+            state.update_position(symbol, qty_delta)
+        return state
+
+    @property
+    def portfolio_history(self) -> List[Dict[str, Any]]:
+        """Per-bar portfolio states, materialized lazily from the delta log."""
+        if self._portfolio_history_cache is None:
+            history = []
+            state = PortfolioState(cash=self.initial_cash)
+            log = self.state_log
+            log_pos = 0
+            n = self._n_recorded
+            if n:
+                for date in pd.DatetimeIndex(self._equity_dates[:n]):
+                    while log_pos < len(log) and pd.Timestamp(log[log_pos][0]) <= date:
+                        _, symbol, qty_delta, cash_delta = log[log_pos]
+                        state.cash += cash_delta
+                        state.update_position(symbol, qty_delta)
+                        log_pos += 1
+                    history.append({'Date': date, 'State': state.copy()})
+            self._portfolio_history_cache = history
+        return self._portfolio_history_cache
+
+    @property
+    def equity_curve(self) -> List[Dict[str, Any]]:
+        """Equity curve as a list of per-bar dicts (materialized lazily)."""
+        if self._equity_curve_cache is None:
+            n = self._n_recorded
+            if n == 0:
+                self._equity_curve_cache = []
+            else:
+                dates = pd.DatetimeIndex(self._equity_dates[:n])
+                self._equity_curve_cache = [
+                    {'Date': date, 'Cash': cash, 'Equity': equity, 'Positions': int(pos)}
+                    for date, cash, equity, pos in zip(
+                        dates, self._equity_cash[:n],
+                        self._equity_vals[:n], self._equity_pos[:n]
+                    )
+                ]
+        return self._equity_curve_cache
+
+    def equity_array(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Equity curve as zero-copy (dates, equity) array views.
+
+        Fast path for numeric consumers (metrics): no DataFrame or
+        list-of-dicts is materialized. Treat the views as read-only.
+        """
+        n = self._n_recorded
+        if n == 0:
+            return (np.empty(0, dtype='datetime64[ns]'),
+                    np.empty(0, dtype=np.float64))
+        return self._equity_dates[:n], self._equity_vals[:n]
+
+    def benchmark_equity_array(
+        self, benchmark_name: str = None
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Benchmark curve as zero-copy (dates, equity) array views.
+
+        Returns None when the named benchmark (or the legacy single
+        benchmark for None) was not recorded in array form.
+        """
+        curve = self._bench_curves.get(benchmark_name or '__legacy__')
+        if not curve or not curve['n']:
+            return None
+        n = curve['n']
+        return curve['dates'][:n], curve['equity'][:n]
+
     def to_dataframe(self) -> pd.DataFrame:
-        """Convert equity curve to DataFrame."""
-        if not self.equity_curve:
+        """Convert equity curve to DataFrame (cached; treat as read-only)."""
+        n = self._n_recorded
+        if n == 0:
             return pd.DataFrame()
-        
-        df = pd.DataFrame(self.equity_curve)
-        df['Date'] = pd.to_datetime(df['Date'])
-        df.set_index('Date', inplace=True)
+
+        cached = self._df_cache.get('__strategy__')
+        if cached is not None and len(cached) == n:
+            return cached
+        df = pd.DataFrame(
+            {
+                'Cash': self._equity_cash[:n],
+                'Equity': self._equity_vals[:n],
+                'Positions': self._equity_pos[:n],
+            },
+            index=pd.DatetimeIndex(self._equity_dates[:n], name='Date')
+        )
+        self._df_cache['__strategy__'] = df
         return df
     
     def get_trades_dataframe(self) -> pd.DataFrame:
         """Convert trades to DataFrame."""
-        if not self.trades:
+        n = self._n_trades
+        if n == 0:
             return pd.DataFrame()
-        
-        trades_data = []
-        for trade in self.trades:
-            trades_data.append({
-                'Date': trade.timestamp,
-                'Symbol': trade.symbol,
-                'Quantity': trade.quantity,
-                'Price': trade.price,
-                'Fees': trade.fees,
-                'Slippage': trade.slippage,
-                'Total_Cost': trade.total_cost
-            })
-        
-        df = pd.DataFrame(trades_data)
-        if not df.empty:
-            df['Date'] = pd.to_datetime(df['Date'])
-            df.set_index('Date', inplace=True)
-        return df
+
+        arr = self._trades_arr[:n]
+        symbols = np.array(self._trade_symbols, dtype=object)[arr['symbol_id']]
+        abs_qty = np.abs(arr['qty'])
+        return pd.DataFrame(
+            {
+                'Symbol': symbols,
+                'Quantity': arr['qty'],
+                'Price': arr['price'],
+                'Fees': arr['fees'],
+                'Slippage': arr['slippage'],
+                # Same formula as Fill.total_cost, vectorized
+                'Total_Cost': abs_qty * arr['price'] + arr['fees'],
+            },
+            index=pd.DatetimeIndex(arr['date'], name='Date')
+        )
     
+    def _benchmark_curve_dataframe(self, name: str) -> Optional[pd.DataFrame]:
+        """Build a benchmark frame straight from its arrays, if recorded.
+
+        Frames are cached per benchmark and treated as read-only.
+        """
+        curve = self._bench_curves.get(name)
+        if not curve or not curve['n']:
+            return None
+        n = curve['n']
+        cached = self._df_cache.get(name)
+        if cached is not None and len(cached) == n:
+            return cached
+        df = pd.DataFrame(
+            {
+                'Cash': curve['cash'][:n],
+                'Equity': curve['equity'][:n],
+                'Positions': curve['positions'][:n],
+            },
+            index=pd.DatetimeIndex(curve['dates'][:n], name='Date')
+        )
+        self._df_cache[name] = df
+        return df
+
     def get_benchmark_dataframe(self, benchmark_name: str = None) -> pd.DataFrame:
         """Convert benchmark equity curve to DataFrame."""
         # Legacy support for single benchmark
         if benchmark_name is None:
+            df = self._benchmark_curve_dataframe('__legacy__')
+            if df is not None:
+                return df
             if not self.benchmark_equity_curve:
                 return pd.DataFrame()
-            
+
             df = pd.DataFrame(self.benchmark_equity_curve)
-            df['Date'] = pd.to_datetime(df['Date'])
+            if not pd.api.types.is_datetime64_any_dtype(df['Date']):
+                df['Date'] = pd.to_datetime(df['Date'])
             df.set_index('Date', inplace=True)
             return df
-        
+
         # Multiple benchmarks support
+        df = self._benchmark_curve_dataframe(benchmark_name)
+        if df is not None:
+            return df
         if benchmark_name not in self.benchmarks:
             return pd.DataFrame()
-        
+
         equity_curve = self.benchmarks[benchmark_name].get('equity_curve', [])
         if not equity_curve:
             return pd.DataFrame()
-        
+
         df = pd.DataFrame(equity_curve)
-        df['Date'] = pd.to_datetime(df['Date'])
+        if not pd.api.types.is_datetime64_any_dtype(df['Date']):
+            df['Date'] = pd.to_datetime(df['Date'])
         df.set_index('Date', inplace=True)
         return df
     
@@ -117,11 +574,12 @@ class Backtester:
         benchmark_strategy: Optional[Strategy] = None,
         benchmark_type: str = None,
         benchmark_strategies: Dict[str, Strategy] = None,
-        benchmark_types: List[str] = None
+        benchmark_types: List[str] = None,
+        verbose: bool = True
     ):
         """
         Initialize backtester.
-        
+
         Args:
             data_source: Data source for market data
             signal_generators: List of signal generators to apply
@@ -132,12 +590,15 @@ class Backtester:
             benchmark_type: Optional single benchmark type (legacy)
             benchmark_strategies: Dict of named benchmark strategies
             benchmark_types: List of benchmark types to create
+            verbose: Show a tqdm progress bar during the day loop (only when
+                tqdm is installed, e.g. via pip install qbt[perf])
         """
         self.data_source = data_source
         self.signal_generators = signal_generators
         self.strategy = strategy
         self.broker = broker
         self.initial_cash = initial_cash
+        self.verbose = verbose
         
         # Handle multiple benchmarks configuration
         self.benchmark_strategies = {}
@@ -164,8 +625,11 @@ class Backtester:
                     self.benchmark_strategies[bench_type] = create_benchmark_strategy(bench_type)
         
         # Set legacy benchmark_strategy to first one if available
-        if not hasattr(self, 'benchmark_strategy') and self.benchmark_strategies:
-            self.benchmark_strategy = next(iter(self.benchmark_strategies.values()))
+        if not hasattr(self, 'benchmark_strategy'):
+            if self.benchmark_strategies:
+                self.benchmark_strategy = next(iter(self.benchmark_strategies.values()))
+            else:
+                self.benchmark_strategy = None
     
     def run(
         self,
@@ -173,18 +637,21 @@ class Backtester:
         start_date: datetime,
         end_date: datetime,
         interval: str = "1d",
-        strategy_name: str = None
+        strategy_name: str = None,
+        progress: Optional[Callable[[int, int], None]] = None
     ) -> BacktestResult:
         """
         Run the backtest.
-        
+
         Args:
             universe: List of symbols to trade
             start_date: Start date for backtest
             end_date: End date for backtest
             interval: Data interval
             strategy_name: Optional name for the strategy (for reporting)
-            
+            progress: Optional callback invoked as progress(done, total)
+                every 50 bars; None keeps the hot loop free of stdout work
+
         Returns:
             BacktestResult with equity curve, trades, and metrics
         """
@@ -203,19 +670,10 @@ class Backtester:
             strategy_name=strategy_name
         )
         
-        # Initialize portfolio state
+        # Initialize portfolio state; benchmark states live inside their
+        # self-contained walks (see _run_benchmark_walk)
         state = PortfolioState(cash=self.initial_cash)
-        
-        # Initialize benchmark states for multiple benchmarks
-        benchmark_states = {}
-        for bench_name in self.benchmark_strategies.keys():
-            benchmark_states[bench_name] = PortfolioState(cash=self.initial_cash)
-        
-        # Legacy benchmark state
-        benchmark_state = None
-        if self.benchmark_strategy:
-            benchmark_state = PortfolioState(cash=self.initial_cash)
-        
+
         # Expand universe to include benchmark symbols if needed
         expanded_universe = universe.copy()
         
@@ -230,9 +688,9 @@ class Backtester:
             benchmark_symbol = self.benchmark_strategy.benchmark_symbol
             if benchmark_symbol not in expanded_universe:
                 expanded_universe.append(benchmark_symbol)
-                print(f"Added benchmark symbol {benchmark_symbol} to universe")
+                logger.debug("Added benchmark symbol %s to universe", benchmark_symbol)
         
-        print(f"DEBUG: Final universe: {expanded_universe}")
+        logger.debug("Final universe: %s", expanded_universe)
         
         # Get market data
         print(f"Fetching data for {expanded_universe} from {start_date} to {end_date}...")
@@ -242,133 +700,318 @@ class Backtester:
             print("No data available for the specified period.")
             return result
         
-        # Apply signal generators
+        # Apply signal generators; with a MultiIndex frame, run the chain in
+        # wide form so every indicator is one vectorized pass over all symbols
         print("Generating signals...")
-        for signal_generator in self.signal_generators:
-            prices_df = signal_generator.transform(prices_df)
+        if self.signal_generators and isinstance(prices_df.index, pd.MultiIndex):
+            wide = prices_df.unstack('Symbol')
+            # Shared panel for the whole chain: every field is extracted
+            # to a (dates x symbols) matrix exactly once and the dict is
+            # handed to each array-capable generator in turn (so later
+            # generators see earlier signal matrices), instead of every
+            # generator re-slicing a growing wide frame. The wide frame
+            # is rebuilt once at the end.
+            symbol_cols = None
+            fields = {}
+            for field in wide.columns.get_level_values(0).unique():
+                block = wide[field]
+                if symbol_cols is None:
+                    # Keep the original column Index so its level name
+                    # ('Symbol') survives into the rebuilt frame
+                    symbol_cols = block.columns
+                else:
+                    block = block.reindex(columns=symbol_cols)
+                fields[field] = block.to_numpy()
+            symbols = list(symbol_cols)
+
+            def _rebuild_wide():
+                return pd.concat(
+                    {field: pd.DataFrame(matrix, index=wide.index,
+                                         columns=symbol_cols)
+                     for field, matrix in fields.items()},
+                    axis=1
+                )
+
+            for signal_generator in self.signal_generators:
+                if (type(signal_generator).transform_arrays
+                        is not SignalGenerator.transform_arrays):
+                    fields.update(signal_generator.transform_arrays(
+                        wide.index, symbols, fields
+                    ))
+                else:
+                    # Pandas-only generator: round-trip through a frame
+                    # built from the current panel
+                    out = signal_generator.wide_transform(_rebuild_wide())
+                    for field in out.columns.get_level_values(0).unique():
+                        if field not in fields:
+                            fields[field] = (
+                                out[field].reindex(columns=symbol_cols)
+                                .to_numpy()
+                            )
+            long_df = _rebuild_wide().stack(level=-1)
+            if 'Close' in long_df.columns:
+                # Drop rows reintroduced by unstacking for dates a symbol
+                # has no data
+                long_df = long_df[long_df['Close'].notna()]
+            prices_df = long_df
+        else:
+            for signal_generator in self.signal_generators:
+                prices_df = signal_generator.transform(prices_df)
         
         # Store market data with signals for visualization
         result.market_data = prices_df.copy()
-        
-        # Get unique dates
-        dates = prices_df.index.get_level_values('Date').unique().sort_values()
-        
-        print(f"Running backtest for {len(dates)} trading days...")
-        
+
+        # Ensure date-ascending order so the day loop is a single linear
+        # traversal; only the Date level matters for grouping and for row
+        # alignment with the Close matrix, so skip the full two-level lexsort
+        # (and skip sorting entirely when the source already sorted).
+        date_level = prices_df.index.get_level_values('Date')
+        if not date_level.is_monotonic_increasing:
+            prices_df = prices_df.sort_index(level='Date', sort_remaining=False)
+        daily_groups = prices_df.groupby(level='Date', sort=False)
+        n_days = daily_groups.ngroups
+        result.preallocate(n_days)
+
+        # Benchmarks are independent of the primary strategy given the same
+        # price stream, so each one is a self-contained walk executed after
+        # the main loop — in its own worker process when there are two or
+        # more. The first benchmark also replays the legacy mirror walk so
+        # its bookkeeping stays identical to the old interleaved loop.
+        benchmark_futures = {}
+        benchmark_deferred = []
+        benchmark_executor = None
+        if self.benchmark_strategies:
+            mirrored = False
+            walks = []
+            for bench_name, bench_strategy in self.benchmark_strategies.items():
+                mirror = not mirrored and bench_strategy is self.benchmark_strategy
+                mirrored = mirrored or mirror
+                walks.append((bench_name, bench_strategy, mirror))
+
+            if len(walks) >= 2:
+                import multiprocessing
+                from concurrent.futures import ProcessPoolExecutor
+                try:
+                    mp_context = multiprocessing.get_context('forkserver')
+                except ValueError:
+                    mp_context = None
+                benchmark_executor = ProcessPoolExecutor(
+                    max_workers=min(len(walks),
+                                    multiprocessing.cpu_count() or 1),
+                    mp_context=mp_context
+                )
+                for bench_name, bench_strategy, mirror in walks:
+                    benchmark_futures[bench_name] = (
+                        benchmark_executor.submit(
+                            _run_benchmark_walk, bench_strategy, self.broker,
+                            prices_df, self.initial_cash, mirror
+                        ),
+                        mirror
+                    )
+            else:
+                benchmark_deferred = walks
+
+        # Precompute a dense (date x symbol) Close matrix so each bar builds its
+        # price dict from a NumPy row instead of materializing a Series dict
+        # (previously done up to three times per bar).
+        if 'Close' in prices_df.columns:
+            close_wide = _fast_unstack(prices_df['Close'])
+            close_arr = close_wide.to_numpy()
+            close_symbols = close_wide.columns.tolist()
+            # NaN-free copy for equity dot products (missing price = no
+            # value); float64 to match the compiled kernel signatures even
+            # when the source stores float32
+            close_filled = np.nan_to_num(close_arr).astype(np.float64, copy=False)
+            # Enable dense position tracking so equity is a single dot product
+            state.bind_symbols(close_symbols)
+            # Zero-copy per-bar prices for the broker: rebinding the view's
+            # row replaces rebuilding a dict over the whole universe
+            price_view = PriceRowView(state.symbol_index)
+            # Universe membership precomputed once as a boolean mask over the
+            # matrix columns; bars carrying the full symbol set (the common,
+            # rectangular case) filter with it instead of a per-day isin
+            close_index = pd.Index(close_symbols, name='Symbol')
+            universe_mask = np.array(
+                [symbol in universe for symbol in close_symbols]
+            )
+            # Per-bar holdings history so the equity curve can be computed in
+            # one JIT-compiled pass after the loop instead of per bar
+            qty_hist = np.empty((n_days, len(close_symbols)), dtype=np.float64)
+            row_idx = np.empty(n_days, dtype=np.int64)
+
+            # Strategies opting into BarView get row slices of precomputed
+            # wide arrays instead of a fresh DataFrame every bar
+            use_bar_view = getattr(self.strategy, 'accepts_bar_view', False)
+            if use_bar_view:
+                wide_all = prices_df.unstack('Symbol')
+                field_rows = {
+                    column: wide_all[column].reindex(columns=close_symbols).to_numpy()
+                    for column in prices_df.columns
+                }
+                view_symbols = tuple(close_symbols)
+        else:
+            close_arr = None
+            close_symbols = []
+            close_filled = None
+            close_index = None
+            qty_hist = None
+            row_idx = None
+            use_bar_view = False
+
+        # Fast path: stateless strategies declare their target weights up
+        # front, so the whole accounting sweep runs in one compiled pass with
+        # no per-bar Python loop (benchmarks still need the loop below)
+        if (getattr(self.strategy, 'is_stateless', False)
+                and close_arr is not None
+                and not self.benchmark_strategies
+                and getattr(self, 'benchmark_strategy', None) is None):
+            print(f"Running vectorized backtest for {n_days} trading days...")
+            self._run_vectorized(result, prices_df, close_wide, close_arr,
+                                 close_symbols, universe)
+            print(f"Backtest completed. Final equity: ${result.final_equity:,.2f}")
+            print(f"Total return: {((result.final_equity / result.initial_cash - 1) * 100):.2f}%")
+            print(f"Number of trades: {len(result.trades)}")
+            return result
+
+        print(f"Running backtest for {n_days} trading days...")
+
+        # Progress reporting: an explicit callback wins; otherwise wrap the
+        # loop in a rate-limited tqdm bar so no per-bar stdout work remains
+        day_iterator = enumerate(daily_groups)
+        if progress is None and self.verbose and tqdm is not None:
+            day_iterator = tqdm(day_iterator, total=n_days,
+                                mininterval=0.5, desc="Backtest")
+
         # Run backtest day by day
-        for i, date in enumerate(dates):
+        for i, (date, symbol_data) in day_iterator:
             try:
-                # Get current date data
-                current_data = prices_df.loc[pd.IndexSlice[date, :], :]
-                
-                # Reset the index to make symbols the index (remove date level)
-                if current_data.index.nlevels > 1:
-                    current_data = current_data.reset_index(level=0, drop=True)
-                
-                # Ensure we have a proper DataFrame
-                if isinstance(current_data, pd.Series):
-                    current_data = current_data.to_frame().T
-                
-                if current_data.empty:
-                    continue
-                
-                symbol_data = current_data
+                # Drop the date level so symbols become the index
+                symbol_data = symbol_data.droplevel('Date')
 
-                # Filter data for strategy to only include original universe symbols
-                strategy_data = symbol_data.loc[symbol_data.index.isin(universe)]
+                if symbol_data.empty:
+                    continue
 
                 # Generate orders
-                orders = self.strategy.on_bar(date, strategy_data, state)
+                if use_bar_view:
+                    bar = BarView(
+                        date=date,
+                        symbols=view_symbols,
+                        tradable=universe_mask,
+                        fields={column: rows[i] for column, rows in field_rows.items()}
+                    )
+                    orders = self.strategy.on_bar(date, bar, state)
+                else:
+                    # Filter data for strategy to only include original
+                    # universe symbols; when the bar carries the full symbol
+                    # set the precomputed mask replaces the isin hashing
+                    if (close_index is not None
+                            and symbol_data.index.equals(close_index)):
+                        strategy_data = symbol_data.loc[universe_mask]
+                    else:
+                        strategy_data = symbol_data.loc[symbol_data.index.isin(universe)]
+                    orders = self.strategy.on_bar(date, strategy_data, state)
 
-                # Execute orders
+                # Execute orders. The broker's mapping API is the only
+                # consumer of string-keyed prices left on this path (the
+                # strategy sees arrays or a frame, positions are tracked by
+                # integer code), and it gets a zero-copy view over the
+                # Close-matrix row instead of a rebuilt dict
                 if orders:
-                    current_prices = symbol_data['Close'].to_dict() if 'Close' in symbol_data.columns else {}
+                    if close_arr is not None:
+                        price_view.row = close_arr[i]
+                        current_prices = price_view
+                    else:
+                        current_prices = {}
                     fills = self.broker.execute(orders, current_prices, state, date)
-                    result.trades.extend(fills)
-
-                # Run multiple benchmark strategies
-                for bench_name, bench_strategy in self.benchmark_strategies.items():
-                    bench_state = benchmark_states[bench_name]
-                    benchmark_orders = bench_strategy.on_bar(date, symbol_data, bench_state)
-                    if benchmark_orders:
-                        current_prices = symbol_data['Close'].to_dict() if 'Close' in symbol_data.columns else {}
-                        benchmark_fills = self.broker.execute(benchmark_orders, current_prices, bench_state, date)
-                        
-                        # Store in benchmarks dict
-                        if bench_name not in result.benchmarks:
-                            result.benchmarks[bench_name] = {'equity_curve': [], 'trades': [], 'final_equity': 0.0}
-                        result.benchmarks[bench_name]['trades'].extend(benchmark_fills)
-
-                # Legacy benchmark strategy support
-                if self.benchmark_strategy and benchmark_state:
-                    benchmark_orders = self.benchmark_strategy.on_bar(date, symbol_data, benchmark_state)
-                    if benchmark_orders:
-                        current_prices = symbol_data['Close'].to_dict() if 'Close' in symbol_data.columns else {}
-                        benchmark_fills = self.broker.execute(benchmark_orders, current_prices, benchmark_state, date)
-                        result.benchmark_trades.extend(benchmark_fills)
-
-                # Record portfolio state
-                current_prices = symbol_data['Close'].to_dict() if 'Close' in symbol_data.columns else {}
-                total_equity = state.get_total_equity(current_prices)
-
-                result.equity_curve.append({
-                    'Date': date,
-                    'Cash': state.cash,
-                    'Equity': total_equity,
-                    'Positions': len(state.positions)
-                })
-
-                # Record multiple benchmark states
-                for bench_name, bench_state in benchmark_states.items():
-                    benchmark_equity = bench_state.get_total_equity(current_prices)
-                    if bench_name not in result.benchmarks:
-                        result.benchmarks[bench_name] = {'equity_curve': [], 'trades': [], 'final_equity': 0.0}
-                    
-                    result.benchmarks[bench_name]['equity_curve'].append({
-                        'Date': date,
-                        'Cash': bench_state.cash,
-                        'Equity': benchmark_equity,
-                        'Positions': len(bench_state.positions)
-                    })
-
-                # Legacy benchmark state recording
-                if benchmark_state:
-                    benchmark_equity = benchmark_state.get_total_equity(current_prices)
-                    result.benchmark_equity_curve.append({
-                        'Date': date,
-                        'Cash': benchmark_state.cash,
-                        'Equity': benchmark_equity,
-                        'Positions': len(benchmark_state.positions)
-                    })
-
-                result.portfolio_history.append({
-                    'Date': date,
-                    'State': state.copy()
-                })
-
-                if (i + 1) % 50 == 0:
-                    print(f"Processed {i + 1}/{len(dates)} days...")
+                    result.record_fills(date, fills)
+
+                # Record portfolio state; with a dense close matrix the equity
+                # values are filled in by one kernel pass after the loop
+                if close_filled is not None:
+                    k = result._n_recorded
+                    qty_hist[k] = state.qty_vec
+                    row_idx[k] = i
+                    result.record_equity_point(date, state.cash, 0.0, len(state.positions))
+                else:
+                    # No Close column: no prices to mark against
+                    result.record_equity_point(date, state.cash, state.cash, len(state.positions))
+
+                if progress is not None and (i + 1) % 50 == 0:
+                    progress(i + 1, n_days)
 
             except Exception as e:
-                print(f"Error processing date {date}: {e}")
+                result.errors.append((date, str(e)))
                 continue
         
+        # Fill in strategy equity values with one fused kernel pass
+        n_recorded = result._n_recorded
+        if close_filled is not None and n_recorded:
+            result._equity_vals[:n_recorded] = compute_equity_curve(
+                close_filled, row_idx[:n_recorded],
+                qty_hist[:n_recorded], result._equity_cash[:n_recorded]
+            )
+            result._equity_curve_cache = None
+
         # Set final equity
-        if result.equity_curve:
-            result.final_equity = result.equity_curve[-1]['Equity']
-        
+        if result._n_recorded:
+            result.final_equity = float(result._equity_vals[result._n_recorded - 1])
+
+        # Run deferred benchmark walks and collect the parallel ones
+        benchmark_walks = []
+        for bench_name, (future, mirror) in benchmark_futures.items():
+            try:
+                walk = future.result()
+            except Exception:
+                # e.g. a strategy that does not pickle: redo the walk
+                # in-process, same semantics minus the parallelism
+                walk = _run_benchmark_walk(
+                    self.benchmark_strategies[bench_name], self.broker,
+                    prices_df, self.initial_cash, mirror
+                )
+            benchmark_walks.append((bench_name, mirror, walk))
+        if benchmark_executor is not None:
+            benchmark_executor.shutdown()
+        for bench_name, bench_strategy, mirror in benchmark_deferred:
+            walk = _run_benchmark_walk(
+                bench_strategy, self.broker, prices_df,
+                self.initial_cash, mirror
+            )
+            benchmark_walks.append((bench_name, mirror, walk))
+
+        for bench_name, mirror, walk in benchmark_walks:
+            (curve, bench_trades, final_equity,
+             legacy_curve, legacy_trades, legacy_final, errors) = walk
+            result._bench_curves[bench_name] = curve
+            result.benchmarks[bench_name] = {
+                'equity_curve': [],
+                'trades': bench_trades,
+                'final_equity': final_equity
+            }
+            result.errors.extend(errors)
+            if mirror:
+                result._bench_curves['__legacy__'] = legacy_curve
+                result.benchmark_trades = legacy_trades
+                result.benchmark_final_equity = legacy_final
+
+        # Expose the recorded benchmark arrays through the public
+        # list-of-dicts curves
+        result.materialize_benchmark_curves()
+
         # Set final equity for multiple benchmarks
         for bench_name in result.benchmarks.keys():
             if result.benchmarks[bench_name]['equity_curve']:
                 result.benchmarks[bench_name]['final_equity'] = result.benchmarks[bench_name]['equity_curve'][-1]['Equity']
             else:
-                print(f"WARNING: {bench_name} has no equity curve data")
+                logger.warning("%s has no equity curve data", bench_name)
                 result.benchmarks[bench_name]['final_equity'] = result.initial_cash  # No change from initial
         
         # Legacy benchmark final equity
         if result.benchmark_equity_curve:
             result.benchmark_final_equity = result.benchmark_equity_curve[-1]['Equity']
         
+        if result.errors:
+            logger.warning("%d bars failed (see result.errors)", len(result.errors))
+
         print(f"Backtest completed. Final equity: ${result.final_equity:,.2f}")
         print(f"Total return: {((result.final_equity / result.initial_cash - 1) * 100):.2f}%")
         print(f"Number of trades: {len(result.trades)}")
@@ -380,9 +1023,11 @@ class Backtester:
                 alpha = ((result.final_equity / result.initial_cash - 1) - (bench_data['final_equity'] / result.initial_cash - 1)) * 100
                 print(f"{bench_name} return: {benchmark_return:.2f}%")
                 print(f"Alpha vs {bench_name}: {alpha:.2f}%")
-                print(f"DEBUG: {bench_name} final equity: ${bench_data['final_equity']:,.2f}, trades: {len(bench_data['trades'])}")
+                logger.debug("%s final equity: $%s, trades: %d", bench_name,
+                             format(bench_data['final_equity'], ',.2f'),
+                             len(bench_data['trades']))
             else:
-                print(f"WARNING: No equity curve data for {bench_name}")
+                logger.warning("No equity curve data for %s", bench_name)
         
         # Legacy benchmark output
         if result.benchmark_equity_curve:
@@ -393,6 +1038,66 @@ class Backtester:
         
         return result
     
+    def _run_vectorized(
+        self,
+        result: BacktestResult,
+        prices_df: pd.DataFrame,
+        close_wide: pd.DataFrame,
+        close_arr: np.ndarray,
+        close_symbols: List[str],
+        universe: List[str]
+    ):
+        """
+        Run the backtest as one compiled accounting sweep (stateless mode).
+
+        The strategy's compute_weights() output is aligned to the close
+        matrix and handed to the simulate_weight_targets kernel, which
+        replays SimpleBroker fill semantics day by day in compiled code.
+        """
+        weights = self.strategy.compute_weights(prices_df)
+        weights = weights.reindex(
+            index=close_wide.index, columns=close_symbols
+        ).to_numpy(dtype=np.float64)
+
+        # Symbols outside the trading universe never receive allocation
+        universe_set = set(universe)
+        for j, symbol in enumerate(close_symbols):
+            if symbol not in universe_set:
+                weights[:, j] = 0.0
+
+        commission = getattr(self.broker, 'commission', 0.0)
+        slippage = getattr(self.broker, 'slippage', 0.0)
+
+        (cash_out, equity_out, qty_out, n_trades,
+         trade_day, trade_sym, trade_qty, trade_price,
+         trade_fees, trade_slip) = simulate_weight_targets(
+            close_arr, weights, self.initial_cash, commission, slippage
+        )
+
+        dates_idx = close_wide.index
+        n_days = len(dates_idx)
+        result._equity_dates[:n_days] = dates_idx.to_numpy(dtype='datetime64[ns]')
+        result._equity_cash[:n_days] = cash_out
+        result._equity_vals[:n_days] = equity_out
+        result._equity_pos[:n_days] = (qty_out != 0).sum(axis=1)
+        result._n_recorded = n_days
+        result._equity_curve_cache = None
+
+        for k in range(n_trades):
+            date = dates_idx[trade_day[k]]
+            fill = Fill(
+                symbol=close_symbols[trade_sym[k]],
+                quantity=int(trade_qty[k]),
+                price=float(trade_price[k]),
+                fees=float(trade_fees[k]),
+                slippage=float(trade_slip[k]),
+                timestamp=date
+            )
+            result.record_fills(date, [fill])
+
+        if n_days:
+            result.final_equity = float(equity_out[-1])
+
     def _create_config(
         self,
         universe: List[str],
@@ -1,12 +1,106 @@
+import math
+import sys
+
 import numpy as np
 import pandas as pd
 from typing import Dict, Any
 from .backtester import BacktestResult
+from ._kernels import equity_stats, max_drawdown_duration
+
+# Annualization factor, hoisted so the per-benchmark loops don't
+# recompute the square root
+_SQRT_252 = math.sqrt(252.0)
+
+
+def _annualize_return(total_return: float, inv_years: float) -> float:
+    """Annualize a total return; expm1/log1p is cheaper and more stable
+    than ``(1 + r) ** (1 / years)`` for the typical near-zero returns."""
+    return math.expm1(math.log1p(total_return) * inv_years)
 
 
 class PerformanceMetrics:
     """Performance metrics calculator for backtest results."""
     
+    @staticmethod
+    def _curve_stats(result: BacktestResult, name: str,
+                     dates, values: np.ndarray):
+        """Fused statistics for one equity curve, memoized on the result.
+
+        Curves never change once a backtest has finished, so the pass over
+        a given curve is computed once and shared between the comparison
+        and standalone metric paths (calculate_all_benchmark_metrics walks
+        each benchmark twice). ``dates`` may be a DatetimeIndex or a raw
+        datetime64 array (the equity_array fast path).
+
+        Returns:
+            Tuple of (returns, drawdown, max_drawdown, sum_r, sum_r2,
+            best_day, worst_day, drawdown_duration, var_5)
+        """
+        cache = getattr(result, '_metrics_cache', None)
+        if cache is None:
+            cache = result._metrics_cache = {}
+        key = (name, len(values))
+        stats = cache.get(key)
+        if stats is None:
+            kernel_stats = equity_stats(values)
+            drawdown_duration = PerformanceMetrics._drawdown_duration_arrays(
+                dates, kernel_stats[1]
+            )
+            # The percentile sorts the returns; doing it here means each
+            # curve pays for that sort once, not once per metric call
+            returns_arr = kernel_stats[0]
+            var_5 = np.percentile(returns_arr, 5) if len(returns_arr) > 0 else 0
+            stats = cache[key] = kernel_stats + (drawdown_duration, var_5)
+        return stats
+
+    @staticmethod
+    def _returns_series(result: BacktestResult, name: str,
+                        dates, values: np.ndarray) -> pd.Series:
+        """Daily returns of a curve as a date-indexed Series, memoized.
+
+        calculate_all_benchmark_metrics aligns the same strategy returns
+        against every benchmark; sharing one Series avoids rebuilding it
+        per comparison.
+        """
+        cache = getattr(result, '_metrics_cache', None)
+        if cache is None:
+            cache = result._metrics_cache = {}
+        key = (name, 'returns_series', len(values))
+        series = cache.get(key)
+        if series is None:
+            returns_arr = PerformanceMetrics._curve_stats(
+                result, name, dates, values
+            )[0]
+            series = cache[key] = pd.Series(returns_arr, index=dates[1:])
+        return series
+
+    @staticmethod
+    def _equity_arrays(result: BacktestResult):
+        """Strategy curve as (dates, values) arrays, preferring the
+        zero-copy accessor over a DataFrame round-trip."""
+        accessor = getattr(result, 'equity_array', None)
+        if accessor is not None:
+            return accessor()
+        df = result.to_dataframe()
+        if df.empty:
+            return (np.empty(0, dtype='datetime64[ns]'),
+                    np.empty(0, dtype=np.float64))
+        return df.index, df['Equity'].to_numpy(dtype=np.float64, copy=False)
+
+    @staticmethod
+    def _benchmark_equity_arrays(result: BacktestResult,
+                                 benchmark_name: str = None):
+        """Benchmark curve as (dates, values) arrays, or None if absent."""
+        accessor = getattr(result, 'benchmark_equity_array', None)
+        if accessor is not None:
+            arrays = accessor(benchmark_name)
+            if arrays is not None:
+                return arrays
+        df = result.get_benchmark_dataframe(benchmark_name)
+        if df.empty:
+            return None
+        return df.index, df['Equity'].to_numpy(dtype=np.float64, copy=False)
+
     @staticmethod
     def calculate_metrics(result: BacktestResult, include_benchmark: bool = True, benchmark_name: str = None) -> Dict[str, Any]:
         """
@@ -22,50 +116,64 @@ class PerformanceMetrics:
         """
         if not result.equity_curve:
             return {}
-        
-        df = result.to_dataframe()
-        equity = df['Equity']
-        
+
+        # Raw (dates, equity) arrays; no DataFrame needed in this path
+        equity_dates, equity_values = PerformanceMetrics._equity_arrays(result)
+
         # Basic metrics
         total_return = (result.final_equity / result.initial_cash) - 1
-        days = len(equity)
+        days = len(equity_values)
         years = days / 252.0  # Trading days per year
-        
-        # Returns
-        daily_returns = equity.pct_change().dropna()
-        
+        inv_years = 1.0 / years if years > 0 else 0.0
+
+        # One fused pass over the curve yields returns, drawdown and the
+        # scalar statistics instead of a chain of Series allocations
+        (returns_arr, drawdown_arr, max_drawdown, sum_r, sum_r2,
+         best_day, worst_day, drawdown_duration, var_5) = (
+            PerformanceMetrics._curve_stats(
+                result, '__strategy__', equity_dates, equity_values
+            )
+        )
+        n_returns = len(returns_arr)
+        # Kept as a Series for date alignment in the benchmark comparison
+        daily_returns = PerformanceMetrics._returns_series(
+            result, '__strategy__', equity_dates, equity_values
+        )
+
         # Annualized return
-        annualized_return = (1 + total_return) ** (1/years) - 1 if years > 0 else 0
-        
-        # Volatility
-        annualized_volatility = daily_returns.std() * np.sqrt(252) if len(daily_returns) > 1 else 0
-        
+        annualized_return = _annualize_return(total_return, inv_years) if years > 0 else 0
+
+        # Volatility (sample standard deviation from the fused sums)
+        if n_returns > 1:
+            variance = max(
+                (sum_r2 - sum_r * sum_r / n_returns) / (n_returns - 1), 0.0
+            )
+            annualized_volatility = np.sqrt(variance * 252)
+        else:
+            annualized_volatility = 0
+
         # Sharpe ratio (assuming 0% risk-free rate)
         sharpe_ratio = annualized_return / annualized_volatility if annualized_volatility > 0 else 0
-        
-        # Maximum drawdown
-        running_max = equity.expanding().max()
-        drawdown = (equity - running_max) / running_max
-        max_drawdown = drawdown.min()
-        
-        # Drawdown duration
-        drawdown_duration = PerformanceMetrics._calculate_drawdown_duration(drawdown)
-        
+
         # Calmar ratio
         calmar_ratio = annualized_return / abs(max_drawdown) if max_drawdown != 0 else 0
-        
-        # Win rate
-        winning_trades = [trade for trade in result.trades if trade.quantity > 0]  # Simplified
-        total_trades = len(result.trades)
-        win_rate = len(winning_trades) / total_trades if total_trades > 0 else 0
+
+        # Win rate (simplified: counts buys) — vectorized over the
+        # structured trade array; no Fill-object list is materialized
+        trades_arr = getattr(result, 'trades_array', None)
+        if trades_arr is not None:
+            total_trades = len(trades_arr)
+            winning_trades = int((trades_arr['qty'] > 0).sum())
+        else:
+            total_trades = len(result.trades)
+            winning_trades = sum(1 for trade in result.trades if trade.quantity > 0)
+        win_rate = winning_trades / total_trades if total_trades > 0 else 0
         
         # Best and worst days
-        best_day = daily_returns.max() if len(daily_returns) > 0 else 0
-        worst_day = daily_returns.min() if len(daily_returns) > 0 else 0
-        
-        # VaR (Value at Risk) - 5% VaR
-        var_5 = np.percentile(daily_returns, 5) if len(daily_returns) > 0 else 0
-        
+        if n_returns == 0:
+            best_day = 0
+            worst_day = 0
+
         metrics = {
             'Total Return (%)': total_return * 100,
             'Annualized Return (%)': annualized_return * 100,
@@ -94,69 +202,98 @@ class PerformanceMetrics:
         if include_benchmark and benchmark_name and benchmark_name in result.benchmarks:
             benchmark_data = result.benchmarks[benchmark_name]
             benchmark_final_equity = benchmark_data['final_equity']
-            benchmark_df = result.get_benchmark_dataframe(benchmark_name)
         # Auto-select first benchmark if none specified but benchmarks exist
         elif include_benchmark and not benchmark_name and result.benchmarks:
             # Use the first available benchmark
             first_benchmark_name = list(result.benchmarks.keys())[0]
             benchmark_data = result.benchmarks[first_benchmark_name]
             benchmark_final_equity = benchmark_data['final_equity']
-            benchmark_df = result.get_benchmark_dataframe(first_benchmark_name)
             benchmark_name = first_benchmark_name  # Set for later use in suffix
         # Legacy single benchmark support
         elif include_benchmark and result.benchmark_equity_curve:
             benchmark_final_equity = result.benchmark_final_equity
-            benchmark_df = result.get_benchmark_dataframe()
-        
+
         if include_benchmark and (
-            (benchmark_name and benchmark_name in result.benchmarks) or 
+            (benchmark_name and benchmark_name in result.benchmarks) or
             (not benchmark_name and result.benchmark_equity_curve) or
             (benchmark_data is not None)  # For auto-selected benchmark
         ):
-            if not benchmark_df.empty:
-                benchmark_equity = benchmark_df['Equity']
-                
+            bench_arrays = PerformanceMetrics._benchmark_equity_arrays(
+                result, benchmark_name
+            )
+            if bench_arrays is not None:
+                bench_curve_dates, bench_curve_values = bench_arrays
+
                 # Benchmark metrics
                 benchmark_total_return = (benchmark_final_equity / result.initial_cash) - 1
-                benchmark_annualized_return = (1 + benchmark_total_return) ** (1/years) - 1 if years > 0 else 0
-                benchmark_daily_returns = benchmark_equity.pct_change().dropna()
-                benchmark_volatility = benchmark_daily_returns.std() * np.sqrt(252) if len(benchmark_daily_returns) > 1 else 0
+                benchmark_annualized_return = _annualize_return(benchmark_total_return, inv_years) if years > 0 else 0
+                # Same memoized fused pass as the strategy curve; shared
+                # with calculate_benchmark_standalone_metrics
+                (bench_returns_arr, _, benchmark_max_drawdown,
+                 bench_sum_r, bench_sum_r2, _, _, _, _) = (
+                    PerformanceMetrics._curve_stats(
+                        result, benchmark_name or '__legacy__',
+                        bench_curve_dates, bench_curve_values
+                    )
+                )
+                n_bench_returns = len(bench_returns_arr)
+                benchmark_daily_returns = PerformanceMetrics._returns_series(
+                    result, benchmark_name or '__legacy__',
+                    bench_curve_dates, bench_curve_values
+                )
+                if n_bench_returns > 1:
+                    bench_variance = max(
+                        (bench_sum_r2 - bench_sum_r * bench_sum_r
+                         / n_bench_returns) / (n_bench_returns - 1), 0.0
+                    )
+                    benchmark_volatility = np.sqrt(bench_variance * 252)
+                else:
+                    benchmark_volatility = 0
                 benchmark_sharpe = benchmark_annualized_return / benchmark_volatility if benchmark_volatility > 0 else 0
                 
-                # Benchmark drawdown
-                benchmark_running_max = benchmark_equity.expanding().max()
-                benchmark_drawdown = (benchmark_equity - benchmark_running_max) / benchmark_running_max
-                benchmark_max_drawdown = benchmark_drawdown.min()
-                
                 # Comparison metrics
                 alpha = (annualized_return - benchmark_annualized_return) * 100
-                
-                # Beta calculation (if we have enough data)
+
+                # Beta, tracking error and information ratio all derive from
+                # one covariance matrix over a single date alignment instead
+                # of two separately aligned DataFrames
                 beta = 0
-                if len(daily_returns) > 1 and len(benchmark_daily_returns) > 1:
-                    # Align the returns by date
-                    aligned_returns = pd.DataFrame({
-                        'strategy': daily_returns,
-                        'benchmark': benchmark_daily_returns
-                    }).dropna()
-                    
-                    if len(aligned_returns) > 1:
-                        cov_matrix = np.cov(aligned_returns['strategy'], aligned_returns['benchmark'])
-                        if len(cov_matrix) == 2 and len(cov_matrix[0]) == 2:
-                            beta = cov_matrix[0, 1] / np.var(aligned_returns['benchmark']) if np.var(aligned_returns['benchmark']) != 0 else 0
-                
-                # Information ratio
                 tracking_error = 0
                 information_ratio = 0
                 if len(daily_returns) > 1 and len(benchmark_daily_returns) > 1:
-                    aligned_returns = pd.DataFrame({
-                        'strategy': daily_returns,
-                        'benchmark': benchmark_daily_returns
-                    }).dropna()
-                    
-                    if len(aligned_returns) > 1:
-                        excess_returns = aligned_returns['strategy'] - aligned_returns['benchmark']
-                        tracking_error = excess_returns.std() * np.sqrt(252)
+                    # Both indices are sorted daily timestamps, so a
+                    # sorted-set intersection plus searchsorted gather
+                    # replaces the hash join pd.concat would run
+                    strat_dates = daily_returns.index.values
+                    bench_dates = benchmark_daily_returns.index.values
+                    if strat_dates.dtype != bench_dates.dtype:
+                        strat_dates = strat_dates.astype('datetime64[ns]')
+                        bench_dates = bench_dates.astype('datetime64[ns]')
+                    strat_idx = strat_dates.view(np.int64)
+                    bench_idx = bench_dates.view(np.int64)
+                    common = np.intersect1d(strat_idx, bench_idx,
+                                            assume_unique=True)
+                    strat_aligned = daily_returns.to_numpy()[
+                        np.searchsorted(strat_idx, common)]
+                    bench_aligned = benchmark_daily_returns.to_numpy()[
+                        np.searchsorted(bench_idx, common)]
+                    # Mirror the old dropna over the joined rows
+                    valid = ~(np.isnan(strat_aligned) | np.isnan(bench_aligned))
+                    if not valid.all():
+                        strat_aligned = strat_aligned[valid]
+                        bench_aligned = bench_aligned[valid]
+                    n_aligned = len(strat_aligned)
+
+                    if n_aligned > 1:
+                        cov = np.cov(strat_aligned, bench_aligned, ddof=1)
+                        # np.var defaults to ddof=0, as the old beta did
+                        benchmark_variance = cov[1, 1] * (n_aligned - 1) / n_aligned
+                        beta = cov[0, 1] / benchmark_variance if benchmark_variance != 0 else 0
+                        # Var(a - b) = Var(a) + Var(b) - 2 Cov(a, b)
+                        excess_variance = max(
+                            cov[0, 0] + cov[1, 1] - 2 * cov[0, 1], 0.0
+                        )
+                        tracking_error = np.sqrt(excess_variance) * _SQRT_252
                         information_ratio = alpha / 100 / tracking_error if tracking_error != 0 else 0
                 
                 # Add benchmark metrics with name suffix if specified
@@ -191,49 +328,51 @@ class PerformanceMetrics:
             return {}
         
         benchmark_data = result.benchmarks[benchmark_name]
-        benchmark_df = result.get_benchmark_dataframe(benchmark_name)
-        
-        if benchmark_df.empty:
+        bench_arrays = PerformanceMetrics._benchmark_equity_arrays(
+            result, benchmark_name
+        )
+        if bench_arrays is None:
             return {}
-        
-        equity = benchmark_df['Equity']
-        
+        bench_dates, bench_values = bench_arrays
+
         # Basic metrics
         benchmark_final_equity = benchmark_data['final_equity']
         total_return = (benchmark_final_equity / result.initial_cash) - 1
-        days = len(equity)
+        days = len(bench_values)
         years = days / 252.0  # Trading days per year
-        
-        # Returns
-        daily_returns = equity.pct_change().dropna()
-        
+        inv_years = 1.0 / years if years > 0 else 0.0
+
+        # Same memoized fused pass as calculate_metrics
+        (returns_arr, drawdown_arr, max_drawdown, sum_r, sum_r2,
+         best_day, worst_day, drawdown_duration, var_5) = (
+            PerformanceMetrics._curve_stats(result, benchmark_name,
+                                            bench_dates, bench_values)
+        )
+        n_returns = len(returns_arr)
+
         # Annualized return
-        annualized_return = (1 + total_return) ** (1/years) - 1 if years > 0 else 0
-        
-        # Volatility
-        annualized_volatility = daily_returns.std() * np.sqrt(252) if len(daily_returns) > 1 else 0
-        
+        annualized_return = _annualize_return(total_return, inv_years) if years > 0 else 0
+
+        # Volatility (sample standard deviation from the fused sums)
+        if n_returns > 1:
+            variance = max(
+                (sum_r2 - sum_r * sum_r / n_returns) / (n_returns - 1), 0.0
+            )
+            annualized_volatility = np.sqrt(variance * 252)
+        else:
+            annualized_volatility = 0
+
         # Sharpe ratio (assuming 0% risk-free rate)
         sharpe_ratio = annualized_return / annualized_volatility if annualized_volatility > 0 else 0
-        
-        # Maximum drawdown
-        running_max = equity.expanding().max()
-        drawdown = (equity - running_max) / running_max
-        max_drawdown = drawdown.min()
-        
-        # Drawdown duration
-        drawdown_duration = PerformanceMetrics._calculate_drawdown_duration(drawdown)
-        
+
         # Calmar ratio
         calmar_ratio = annualized_return / abs(max_drawdown) if max_drawdown != 0 else 0
-        
+
         # Best and worst days
-        best_day = daily_returns.max() if len(daily_returns) > 0 else 0
-        worst_day = daily_returns.min() if len(daily_returns) > 0 else 0
-        
-        # VaR (Value at Risk) - 5% VaR
-        var_5 = np.percentile(daily_returns, 5) if len(daily_returns) > 0 else 0
-        
+        if n_returns == 0:
+            best_day = 0
+            worst_day = 0
+
         return {
             'Total Return (%)': total_return * 100,
             'Annualized Return (%)': annualized_return * 100,
@@ -282,59 +421,63 @@ class PerformanceMetrics:
         
         return all_metrics
     
+    @staticmethod
+    def _drawdown_duration_arrays(dates, drawdown: np.ndarray) -> int:
+        """Maximum drawdown duration in days from raw date/drawdown arrays.
+
+        ``dates`` may be a DatetimeIndex or a datetime64 array.
+        """
+        if len(drawdown) == 0:
+            return 0
+
+        # Single compiled scan over (timestamp, drawdown) pairs; -1 marks
+        # a curve that never recovers, reported as the full bar count to
+        # match the legacy behaviour
+        ts_days = np.asarray(dates).astype(
+            'datetime64[D]', copy=False
+        ).view(np.int64)
+        longest = max_drawdown_duration(ts_days, drawdown)
+        return len(drawdown) if longest < 0 else int(longest)
+
     @staticmethod
     def _calculate_drawdown_duration(drawdown: pd.Series) -> int:
         """Calculate maximum drawdown duration in days."""
-        if drawdown.empty:
-            return 0
-        
-        in_drawdown = drawdown < 0
-        
-        if not in_drawdown.any():
-            return 0
-        
-        # Find drawdown periods
-        drawdown_starts = in_drawdown & ~in_drawdown.shift(1, fill_value=False)
-        drawdown_ends = ~in_drawdown & in_drawdown.shift(1, fill_value=False)
-        
-        if not drawdown_starts.any() or not drawdown_ends.any():
-            return len(drawdown) if in_drawdown.iloc[-1] else 0
-        
-        starts = drawdown.index[drawdown_starts]
-        ends = drawdown.index[drawdown_ends]
-        
-        # Handle case where we end in drawdown
-        if len(starts) > len(ends):
-            ends = ends.append(pd.Index([drawdown.index[-1]]))
-        
-        # Calculate durations
-        durations = [(end - start).days for start, end in zip(starts[:len(ends)], ends)]
-        
-        return max(durations) if durations else 0
+        return PerformanceMetrics._drawdown_duration_arrays(
+            drawdown.index, drawdown.to_numpy(dtype=np.float64, copy=False)
+        )
     
+    # Exact numeric formats per key; keys not listed fall back to the
+    # suffix rules (percent / dollar) or the default two-decimal format
+    _FMT_TABLE = {
+        'Sharpe Ratio': '{:>10.2f}',
+        'Calmar Ratio': '{:>10.2f}',
+        'Trading Days': '{:>10.0f}',
+        'Total Trades': '{:>10.0f}',
+        'Years': '{:>10.1f}',
+    }
+
     @staticmethod
     def print_metrics(metrics: Dict[str, Any]) -> None:
         """Print metrics in a formatted way."""
-        print("\n" + "="*50)
-        print("PERFORMANCE METRICS")
-        print("="*50)
-        
-        # Format and print each metric
+        fmt_table = PerformanceMetrics._FMT_TABLE
+        bar = "=" * 50
+        lines = ["", bar, "PERFORMANCE METRICS", bar]
+
+        # Format each metric, then emit the whole block in one write
         for key, value in metrics.items():
             if isinstance(value, (int, float)):
-                if key.endswith('(%)'):
-                    print(f"{key:<30}: {value:>10.2f}%")
+                fmt = fmt_table.get(key)
+                if fmt is not None:
+                    rendered = fmt.format(value)
+                elif key.endswith('(%)'):
+                    rendered = f"{value:>10.2f}%"
                 elif key.endswith('($)'):
-                    print(f"{key:<30}: ${value:>13,.2f}")
-                elif key in ['Sharpe Ratio', 'Calmar Ratio']:
-                    print(f"{key:<30}: {value:>10.2f}")
-                elif key in ['Trading Days', 'Total Trades']:
-                    print(f"{key:<30}: {value:>10.0f}")
-                elif key == 'Years':
-                    print(f"{key:<30}: {value:>10.1f}")
+                    rendered = f"${value:>13,.2f}"
                 else:
-                    print(f"{key:<30}: {value:>10.2f}")
+                    rendered = f"{value:>10.2f}"
+                lines.append(f"{key:<30}: {rendered}")
             else:
-                print(f"{key:<30}: {value}")
-        
-        print("="*50)
\ No newline at end of file
+                lines.append(f"{key:<30}: {value}")
+
+        lines.append(bar)
+        sys.stdout.write("\n".join(lines) + "\n")
\ No newline at end of file
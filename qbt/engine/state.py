@@ -1,9 +1,71 @@
+import sys
 from dataclasses import dataclass, field
-from typing import Dict, Optional
+from typing import Dict, List, NamedTuple, Optional, Tuple
 from datetime import datetime
+import numpy as np
 
+# Order, Fill and PortfolioState are built in inner loops; slots drop the
+# per-instance __dict__ (less memory, faster attribute access) where the
+# interpreter supports dataclass slots (3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+class BarView(NamedTuple):
+    """Lightweight view of one bar of market data.
+
+    Passed to strategies that set accepts_bar_view = True instead of a
+    per-bar DataFrame: field rows are slices of precomputed wide arrays, so
+    no DataFrame is constructed in the day loop.
+    """
+    date: datetime
+    symbols: Tuple[str, ...]
+    tradable: np.ndarray  # boolean mask: symbol is in the trading universe
+    fields: Dict[str, np.ndarray]  # column name -> row aligned to symbols
+
+    def get(self, column: str) -> Optional[np.ndarray]:
+        """Return the row array for a column, or None if absent."""
+        return self.fields.get(column)
+
+
+class PriceRowView:
+    """Read-only symbol -> price mapping over one row of the close matrix.
+
+    Duck-types the per-bar price dict the broker consumes, but is a
+    zero-copy view: ``row`` is rebound to the current bar's matrix row
+    instead of rebuilding a dict over the whole universe every trading
+    bar. Symbols with no data today (NaN in the row) act as absent keys.
+    """
+    __slots__ = ('symbol_index', 'row')
+
+    def __init__(self, symbol_index: Dict[str, int],
+                 row: Optional[np.ndarray] = None):
+        self.symbol_index = symbol_index
+        self.row = row
+
+    def get(self, symbol: str, default=None):
+        """Return the symbol's price today, or default if absent/NaN."""
+        idx = self.symbol_index.get(symbol)
+        if idx is None:
+            return default
+        price = self.row[idx]
+        if price != price:
+            return default
+        return price
+
+    def __contains__(self, symbol: str) -> bool:
+        idx = self.symbol_index.get(symbol)
+        return idx is not None and self.row[idx] == self.row[idx]
+
+    def __getitem__(self, symbol: str):
+        idx = self.symbol_index.get(symbol)
+        if idx is not None:
+            price = self.row[idx]
+            if price == price:
+                return price
+        raise KeyError(symbol)
+
+
+@dataclass(**_SLOTS)
 class Order:
     """Represents a trading order."""
     symbol: str
@@ -12,7 +74,7 @@ class Order:
     timestamp: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Fill:
     """Represents an executed trade."""
     symbol: str
@@ -21,44 +83,104 @@ class Fill:
     fees: float
     slippage: float
     timestamp: datetime
-    
-    @property
-    def total_cost(self) -> float:
-        """Total cost including fees and slippage."""
-        return abs(self.quantity) * self.price + self.fees + abs(self.quantity) * self.slippage
+    # Total cost including fees; price is the execution price, which
+    # already carries the slippage. Computed once at construction instead
+    # of on every property access
+    total_cost: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.total_cost = abs(self.quantity) * self.price + self.fees
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PortfolioState:
     """Holds the current state of the portfolio."""
     cash: float = 100000.0
     positions: Dict[str, int] = field(default_factory=dict)
-    
+    # Dense position tracking, enabled via bind_symbols(); kept in sync with
+    # the positions dict so equity can be computed as a single dot product
+    symbol_index: Optional[Dict[str, int]] = field(default=None, repr=False)
+    qty_vec: Optional[np.ndarray] = field(default=None, repr=False)
+
+    def bind_symbols(self, symbols: List[str]):
+        """Enable dense position tracking aligned to the given symbol order."""
+        self.symbol_index = {symbol: i for i, symbol in enumerate(symbols)}
+        self.qty_vec = np.zeros(len(symbols), dtype=np.float64)
+        for symbol, position in self.positions.items():
+            idx = self.symbol_index.get(symbol)
+            if idx is not None:
+                self.qty_vec[idx] = position
+
     def get_position(self, symbol: str) -> int:
         """Get current position for a symbol."""
         return self.positions.get(symbol, 0)
-    
+
     def update_position(self, symbol: str, quantity: int):
         """Update position for a symbol."""
         current_position = self.get_position(symbol)
         new_position = current_position + quantity
-        
+
         if new_position == 0:
             self.positions.pop(symbol, None)
         else:
             self.positions[symbol] = new_position
-    
+
+        if self.qty_vec is not None:
+            idx = self.symbol_index.get(symbol)
+            if idx is not None:
+                self.qty_vec[idx] = new_position
+
     def get_total_equity(self, prices: Dict[str, float]) -> float:
         """Calculate total portfolio equity given current prices."""
-        equity = self.cash
-        for symbol, position in self.positions.items():
-            if symbol in prices:
-                equity += position * prices[symbol]
-        return equity
-    
+        if not self.positions:
+            return self.cash
+        n = len(self.positions)
+        if n < 8:
+            # NumPy call overhead dominates for a handful of positions
+            equity = self.cash
+            for symbol, position in self.positions.items():
+                if symbol in prices:
+                    equity += position * prices[symbol]
+            return equity
+        qty_arr = np.fromiter(self.positions.values(), dtype=np.float64,
+                              count=n)
+        price_arr = np.fromiter(
+            (prices.get(symbol, 0.0) for symbol in self.positions),
+            dtype=np.float64, count=n
+        )
+        return self.cash + float(qty_arr @ price_arr)
+
+    def get_positions_vec(self) -> Optional[np.ndarray]:
+        """Return the dense position vector aligned to the bound symbols.
+
+        None until bind_symbols() has been called. The array is live
+        state — callers must treat it as read-only.
+        """
+        return self.qty_vec
+
+    def get_total_equity_row(self, price_row: np.ndarray) -> float:
+        """Calculate total equity from a dense price row that may hold NaN.
+
+        One vectorized multiply over the bound universe (NaN prices mark
+        symbols with no bar today and contribute nothing), replacing a
+        per-position dict lookup loop. Requires bind_symbols() to have
+        been called with the symbol order matching price_row.
+        """
+        return self.cash + float(np.nansum(self.qty_vec * price_row))
+
+    def get_total_equity_vec(self, price_row: np.ndarray) -> float:
+        """Calculate total equity from a dense price row (NaNs must be zeroed).
+
+        Requires bind_symbols() to have been called with the symbol order
+        matching price_row.
+        """
+        return self.cash + float(self.qty_vec @ price_row)
+
     def copy(self) -> 'PortfolioState':
         """Create a copy of the portfolio state."""
         return PortfolioState(
             cash=self.cash,
-            positions=self.positions.copy()
+            positions=self.positions.copy(),
+            symbol_index=self.symbol_index,
+            qty_vec=None if self.qty_vec is None else self.qty_vec.copy()
         )
\ No newline at end of file
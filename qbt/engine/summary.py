@@ -1,5 +1,5 @@
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_pdf import PdfPages
+# matplotlib is imported lazily (inside the methods that draw) so that
+# importing the engine package does not pull in the plotting stack.
 import pandas as pd
 import numpy as np
 from datetime import datetime
@@ -13,7 +13,19 @@ from .viz import Visualizer
 
 class SummaryReport:
     """Generate comprehensive PDF reports for backtest results."""
-    
+
+    # rcParams applied while rendering a report (see generate_pdf)
+    _RENDER_PARAMS = {
+        'path.simplify': True,
+        'path.simplify_threshold': 1.0,
+        # Maximum stream compression and TrueType fonts keep the file small;
+        # 100 dpi is plenty for any rasterized artists at page size
+        'pdf.compression': 9,
+        'pdf.fonttype': 42,
+        'savefig.dpi': 100,
+    }
+
+
     def __init__(self, result: BacktestResult):
         """
         Initialize summary report.
@@ -41,20 +53,36 @@ class SummaryReport:
         Returns:
             Path to generated PDF file
         """
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_pdf import PdfPages
+        from matplotlib.figure import Figure
+
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"backtest_report_{timestamp}.pdf"
-        
-        with PdfPages(filename) as pdf:
+
+        # Batch-oriented render settings, scoped to report generation only:
+        # path simplification collapses runs of nearly-collinear points in
+        # long line plots before they hit the PDF backend. The global backend
+        # is left alone so interactive plt.show() flows keep working.
+        with plt.rc_context(self._RENDER_PARAMS), PdfPages(filename) as pdf:
+            # One portrait figure is shared by every text-only page: each
+            # helper clears the axes and redraws instead of paying figure
+            # setup/teardown per page. Built as a bare Figure, never
+            # registered with pyplot, so there is no global figure manager
+            # or GUI canvas involved
+            text_fig = Figure(figsize=(8.5, 11))
+            text_ax = text_fig.add_subplot(111)
+
             # Title page
-            self._create_title_page(pdf)
-            
+            self._create_title_page(pdf, text_fig, text_ax)
+
             # Configuration summary
-            self._create_config_page(pdf)
-            
+            self._create_config_page(pdf, text_fig, text_ax)
+
             # Performance metrics
-            self._create_metrics_page(pdf)
-            
+            self._create_metrics_page(pdf, text_fig, text_ax)
+
             # Benchmark comparison (if available)
             has_benchmarks = bool(self.result.benchmark_equity_curve or self.result.benchmarks)
             if has_benchmarks:
@@ -63,7 +91,7 @@ class SummaryReport:
                     pass
                 else:
                     # Single benchmark - create comparison page
-                    self._create_benchmark_comparison_page(pdf)
+                    self._create_benchmark_comparison_page(pdf, text_fig, text_ax)
             
             # Equity curve and visualizations
             try:
@@ -100,7 +128,7 @@ class SummaryReport:
             # Order history
             try:
                 print("Creating order history page...")
-                self._create_order_history_page(pdf)
+                self._create_order_history_page(pdf, text_fig, text_ax)
                 print("✓ Order history page created")
             except Exception as e:
                 print(f"✗ Error creating order history page: {e}")
@@ -118,15 +146,15 @@ class SummaryReport:
                 self._create_monthly_heatmap_page(pdf)
             except Exception as e:
                 print(f"Could not generate monthly heatmap: {e}")
-        
+
         print(f"PDF report generated: {filename}")
         return filename
     
-    def _create_title_page(self, pdf: PdfPages):
+    def _create_title_page(self, pdf: 'PdfPages', fig, ax):
         """Create title page."""
-        fig, ax = plt.subplots(figsize=(8.5, 11))
+        ax.clear()
         ax.axis('off')
-        
+
         # Title
         ax.text(0.5, 0.8, 'Quantitative Backtesting Report', 
                ha='center', va='center', fontsize=24, fontweight='bold')
@@ -150,156 +178,119 @@ class SummaryReport:
         
         # Generation info
         generation_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        ax.text(0.5, 0.2, f'Report generated: {generation_time}', 
+        ax.text(0.5, 0.2, f'Report generated: {generation_time}',
                ha='center', va='center', fontsize=10, style='italic')
-        
+
         pdf.savefig(fig, bbox_inches='tight')
-        plt.close(fig)
-    
-    def _create_config_page(self, pdf: PdfPages):
+
+    def _create_config_page(self, pdf: 'PdfPages', fig, ax):
         """Create configuration summary page."""
-        fig, ax = plt.subplots(figsize=(8.5, 11))
+        ax.clear()
         ax.axis('off')
-        
-        ax.text(0.5, 0.95, 'Backtest Configuration', 
+
+        ax.text(0.5, 0.95, 'Backtest Configuration',
                ha='center', va='top', fontsize=18, fontweight='bold')
-        
-        # Create configuration text
-        config_lines = []
-        
-        # Basic parameters
-        config_lines.append("BASIC PARAMETERS")
-        config_lines.append("=" * 50)
-        config_lines.append(f"Universe: {', '.join(self.config.get('universe', []))}")
-        config_lines.append(f"Start Date: {self.result.start_date}")
-        config_lines.append(f"End Date: {self.result.end_date}")
-        config_lines.append(f"Initial Cash: ${self.result.initial_cash:,.2f}")
-        config_lines.append(f"Trading Interval: {self.config.get('interval', '1d')}")
-        config_lines.append("")
-        
-        # Strategy configuration
-        config_lines.append("STRATEGY CONFIGURATION")
-        config_lines.append("=" * 50)
+
+        # Assemble the page as one template per section (joined by blank
+        # lines) instead of appending line by line
+        bar = "=" * 50
         strategy_config = self.config.get('strategy', {})
-        for key, value in strategy_config.items():
-            config_lines.append(f"{key}: {value}")
-        config_lines.append("")
-        
-        # Signal generators
-        config_lines.append("SIGNAL GENERATORS")
-        config_lines.append("=" * 50)
         signals_config = self.config.get('signals', [])
-        for i, signal in enumerate(signals_config, 1):
-            config_lines.append(f"{i}. {signal}")
-        config_lines.append("")
-        
-        # Broker configuration
-        config_lines.append("BROKER CONFIGURATION")
-        config_lines.append("=" * 50)
         broker_config = self.config.get('broker', {})
-        for key, value in broker_config.items():
-            config_lines.append(f"{key}: {value}")
-        
+
+        sections = [
+            f"BASIC PARAMETERS\n{bar}\n"
+            f"Universe: {', '.join(self.config.get('universe', []))}\n"
+            f"Start Date: {self.result.start_date}\n"
+            f"End Date: {self.result.end_date}\n"
+            f"Initial Cash: ${self.result.initial_cash:,.2f}\n"
+            f"Trading Interval: {self.config.get('interval', '1d')}",
+
+            '\n'.join(["STRATEGY CONFIGURATION", bar] +
+                      [f"{key}: {value}" for key, value in strategy_config.items()]),
+
+            '\n'.join(["SIGNAL GENERATORS", bar] +
+                      [f"{i}. {signal}" for i, signal in enumerate(signals_config, 1)]),
+
+            '\n'.join(["BROKER CONFIGURATION", bar] +
+                      [f"{key}: {value}" for key, value in broker_config.items()]),
+        ]
+
         # Benchmark configuration - handle both single and multiple benchmarks
-        has_benchmarks = bool(self.result.benchmark_equity_curve or self.result.benchmarks)
-        
-        if has_benchmarks:
-            config_lines.append("")
-            config_lines.append("BENCHMARK CONFIGURATION")
-            config_lines.append("=" * 50)
-            
-            # Multiple benchmarks (new system)
-            if self.result.benchmarks:
-                config_lines.append(f"Multiple Benchmarks: {len(self.result.benchmarks)}")
-                for i, benchmark_name in enumerate(self.result.get_benchmark_names(), 1):
-                    config_lines.append(f"{i}. {benchmark_name}")
-                    
-                    # Add benchmark details from config if available
-                    benchmark_configs = self.config.get('benchmarks', {})
-                    if benchmark_name in benchmark_configs:
-                        benchmark_config = benchmark_configs[benchmark_name]
-                        for key, value in benchmark_config.items():
-                            config_lines.append(f"   {key}: {value}")
-            
-            # Legacy single benchmark
-            elif self.result.benchmark_equity_curve:
-                benchmark_config = self.config.get('benchmark', {})
-                for key, value in benchmark_config.items():
-                    config_lines.append(f"{key}: {value}")
-        
-        config_text = '\n'.join(config_lines)
-        ax.text(0.05, 0.9, config_text, ha='left', va='top', fontsize=10, 
+        if self.result.benchmarks:
+            benchmark_lines = ["BENCHMARK CONFIGURATION", bar,
+                               f"Multiple Benchmarks: {len(self.result.benchmarks)}"]
+            benchmark_configs = self.config.get('benchmarks', {})
+            for i, benchmark_name in enumerate(self.result.get_benchmark_names(), 1):
+                benchmark_lines.append(f"{i}. {benchmark_name}")
+                # Add benchmark details from config if available
+                if benchmark_name in benchmark_configs:
+                    for key, value in benchmark_configs[benchmark_name].items():
+                        benchmark_lines.append(f"   {key}: {value}")
+            sections.append('\n'.join(benchmark_lines))
+        elif self.result.benchmark_equity_curve:
+            benchmark_config = self.config.get('benchmark', {})
+            sections.append(
+                '\n'.join(["BENCHMARK CONFIGURATION", bar] +
+                          [f"{key}: {value}" for key, value in benchmark_config.items()]))
+
+        config_text = '\n\n'.join(sections)
+        ax.text(0.05, 0.9, config_text, ha='left', va='top', fontsize=10,
                fontfamily='monospace', transform=ax.transAxes)
-        
+
         pdf.savefig(fig, bbox_inches='tight')
-        plt.close(fig)
-    
-    def _create_metrics_page(self, pdf: PdfPages):
+
+    def _create_metrics_page(self, pdf: 'PdfPages', fig, ax):
         """Create performance metrics page."""
         # Handle multiple benchmarks vs single benchmark
         if self.all_metrics:
             self._create_multiple_benchmarks_metrics_pages(pdf)
         else:
-            self._create_single_benchmark_metrics_page(pdf)
-    
-    def _create_single_benchmark_metrics_page(self, pdf: PdfPages):
+            self._create_single_benchmark_metrics_page(pdf, fig, ax)
+
+    def _create_single_benchmark_metrics_page(self, pdf: 'PdfPages', fig, ax):
         """Create metrics page for single benchmark system."""
-        fig, ax = plt.subplots(figsize=(8.5, 11))
+        ax.clear()
         ax.axis('off')
-        
-        ax.text(0.5, 0.95, 'Performance Metrics', 
+
+        ax.text(0.5, 0.95, 'Performance Metrics',
                ha='center', va='top', fontsize=18, fontweight='bold')
-        
-        # Format metrics into two columns
-        metrics_lines = []
-        
-        # Core metrics
-        metrics_lines.append("RETURN METRICS")
-        metrics_lines.append("=" * 40)
-        metrics_lines.append(f"Total Return: {self.metrics.get('Total Return (%)', 0):.2f}%")
-        metrics_lines.append(f"Annualized Return: {self.metrics.get('Annualized Return (%)', 0):.2f}%")
-        metrics_lines.append(f"Final Equity: ${self.metrics.get('Final Equity ($)', 0):,.2f}")
-        metrics_lines.append("")
-        
-        # Risk metrics
-        metrics_lines.append("RISK METRICS")
-        metrics_lines.append("=" * 40)
-        metrics_lines.append(f"Annualized Volatility: {self.metrics.get('Annualized Volatility (%)', 0):.2f}%")
-        metrics_lines.append(f"Maximum Drawdown: {self.metrics.get('Maximum Drawdown (%)', 0):.2f}%")
-        metrics_lines.append(f"Max Drawdown Duration: {self.metrics.get('Max Drawdown Duration (days)', 0):.0f} days")
-        metrics_lines.append(f"VaR (5%): {self.metrics.get('VaR 5% (%)', 0):.2f}%")
-        metrics_lines.append("")
-        
-        # Risk-adjusted metrics
-        metrics_lines.append("RISK-ADJUSTED METRICS")
-        metrics_lines.append("=" * 40)
-        metrics_lines.append(f"Sharpe Ratio: {self.metrics.get('Sharpe Ratio', 0):.2f}")
-        metrics_lines.append(f"Calmar Ratio: {self.metrics.get('Calmar Ratio', 0):.2f}")
-        metrics_lines.append("")
-        
-        # Trading metrics
-        metrics_lines.append("TRADING METRICS")
-        metrics_lines.append("=" * 40)
-        metrics_lines.append(f"Total Trades: {self.metrics.get('Total Trades', 0):.0f}")
-        metrics_lines.append(f"Win Rate: {self.metrics.get('Win Rate (%)', 0):.2f}%")
-        metrics_lines.append(f"Best Day: {self.metrics.get('Best Day (%)', 0):.2f}%")
-        metrics_lines.append(f"Worst Day: {self.metrics.get('Worst Day (%)', 0):.2f}%")
-        metrics_lines.append("")
-        
-        # Time metrics
-        metrics_lines.append("TIME METRICS")
-        metrics_lines.append("=" * 40)
-        metrics_lines.append(f"Trading Days: {self.metrics.get('Trading Days', 0):.0f}")
-        metrics_lines.append(f"Years: {self.metrics.get('Years', 0):.1f}")
-        
-        metrics_text = '\n'.join(metrics_lines)
-        ax.text(0.05, 0.9, metrics_text, ha='left', va='top', fontsize=11, 
+
+        # The page layout is fixed, so the whole body is one template
+        m = self.metrics
+        bar = "=" * 40
+        metrics_text = (
+            f"RETURN METRICS\n{bar}\n"
+            f"Total Return: {m.get('Total Return (%)', 0):.2f}%\n"
+            f"Annualized Return: {m.get('Annualized Return (%)', 0):.2f}%\n"
+            f"Final Equity: ${m.get('Final Equity ($)', 0):,.2f}\n"
+            f"\n"
+            f"RISK METRICS\n{bar}\n"
+            f"Annualized Volatility: {m.get('Annualized Volatility (%)', 0):.2f}%\n"
+            f"Maximum Drawdown: {m.get('Maximum Drawdown (%)', 0):.2f}%\n"
+            f"Max Drawdown Duration: {m.get('Max Drawdown Duration (days)', 0):.0f} days\n"
+            f"VaR (5%): {m.get('VaR 5% (%)', 0):.2f}%\n"
+            f"\n"
+            f"RISK-ADJUSTED METRICS\n{bar}\n"
+            f"Sharpe Ratio: {m.get('Sharpe Ratio', 0):.2f}\n"
+            f"Calmar Ratio: {m.get('Calmar Ratio', 0):.2f}\n"
+            f"\n"
+            f"TRADING METRICS\n{bar}\n"
+            f"Total Trades: {m.get('Total Trades', 0):.0f}\n"
+            f"Win Rate: {m.get('Win Rate (%)', 0):.2f}%\n"
+            f"Best Day: {m.get('Best Day (%)', 0):.2f}%\n"
+            f"Worst Day: {m.get('Worst Day (%)', 0):.2f}%\n"
+            f"\n"
+            f"TIME METRICS\n{bar}\n"
+            f"Trading Days: {m.get('Trading Days', 0):.0f}\n"
+            f"Years: {m.get('Years', 0):.1f}"
+        )
+        ax.text(0.05, 0.9, metrics_text, ha='left', va='top', fontsize=11,
                fontfamily='monospace', transform=ax.transAxes)
-        
+
         pdf.savefig(fig, bbox_inches='tight')
-        plt.close(fig)
-    
-    def _create_multiple_benchmarks_metrics_pages(self, pdf: PdfPages):
+
+    def _create_multiple_benchmarks_metrics_pages(self, pdf: 'PdfPages'):
         """Create comprehensive comparison table for all benchmarks."""
         self._create_benchmarks_comparison_table(pdf)
         
@@ -309,9 +300,12 @@ class SummaryReport:
         #     if 'Strategy vs' in name:
         #         self._create_individual_benchmark_page(pdf, name, metrics)
     
-    def _create_benchmarks_comparison_table(self, pdf: PdfPages):
+    def _create_benchmarks_comparison_table(self, pdf: 'PdfPages'):
         """Create a comparison table showing strategy vs all benchmarks."""
-        fig, ax = plt.subplots(figsize=(11, 8.5))  # Landscape orientation for table
+        from matplotlib.figure import Figure
+
+        fig = Figure(figsize=(11, 8.5))  # Landscape orientation for table
+        ax = fig.add_subplot(111)
         ax.axis('off')
         
         ax.text(0.5, 0.95, 'Performance Comparison Table', 
@@ -430,63 +424,54 @@ class SummaryReport:
                 if i % 2 == 0:
                     for j in range(len(headers)):
                         table[(i, j)].set_facecolor('#f8f9fa')
-        
+
         pdf.savefig(fig, bbox_inches='tight')
-        plt.close(fig)
-    
-    def _create_benchmark_comparison_page(self, pdf: PdfPages):
+
+    def _create_benchmark_comparison_page(self, pdf: 'PdfPages', fig, ax):
         """Create benchmark comparison page."""
-        fig, ax = plt.subplots(figsize=(8.5, 11))
+        ax.clear()
         ax.axis('off')
-        
-        ax.text(0.5, 0.95, 'Benchmark Comparison', 
+
+        ax.text(0.5, 0.95, 'Benchmark Comparison',
                ha='center', va='top', fontsize=18, fontweight='bold')
-        
-        # Benchmark comparison metrics
-        comparison_lines = []
-        
-        comparison_lines.append("STRATEGY vs BENCHMARK")
-        comparison_lines.append("=" * 50)
-        comparison_lines.append(f"Strategy Return: {self.metrics.get('Total Return (%)', 0):.2f}%")
-        comparison_lines.append(f"Benchmark Return: {self.metrics.get('Benchmark Total Return (%)', 0):.2f}%")
-        comparison_lines.append(f"Alpha: {self.metrics.get('Alpha (%)', 0):.2f}%")
-        comparison_lines.append("")
-        
-        comparison_lines.append("ANNUALIZED COMPARISON")
-        comparison_lines.append("=" * 50)
-        comparison_lines.append(f"Strategy Ann. Return: {self.metrics.get('Annualized Return (%)', 0):.2f}%")
-        comparison_lines.append(f"Benchmark Ann. Return: {self.metrics.get('Benchmark Annualized Return (%)', 0):.2f}%")
-        comparison_lines.append("")
-        
-        comparison_lines.append("RISK COMPARISON")
-        comparison_lines.append("=" * 50)
-        comparison_lines.append(f"Strategy Volatility: {self.metrics.get('Annualized Volatility (%)', 0):.2f}%")
-        comparison_lines.append(f"Benchmark Volatility: {self.metrics.get('Benchmark Volatility (%)', 0):.2f}%")
-        comparison_lines.append(f"Strategy Max DD: {self.metrics.get('Maximum Drawdown (%)', 0):.2f}%")
-        comparison_lines.append(f"Benchmark Max DD: {self.metrics.get('Benchmark Max Drawdown (%)', 0):.2f}%")
-        comparison_lines.append("")
-        
-        comparison_lines.append("RISK-ADJUSTED COMPARISON")
-        comparison_lines.append("=" * 50)
-        comparison_lines.append(f"Strategy Sharpe: {self.metrics.get('Sharpe Ratio', 0):.2f}")
-        comparison_lines.append(f"Benchmark Sharpe: {self.metrics.get('Benchmark Sharpe Ratio', 0):.2f}")
-        comparison_lines.append("")
-        
-        comparison_lines.append("RELATIVE PERFORMANCE")
-        comparison_lines.append("=" * 50)
-        comparison_lines.append(f"Beta: {self.metrics.get('Beta', 0):.2f}")
-        comparison_lines.append(f"Tracking Error: {self.metrics.get('Tracking Error (%)', 0):.2f}%")
-        comparison_lines.append(f"Information Ratio: {self.metrics.get('Information Ratio', 0):.2f}")
-        
-        comparison_text = '\n'.join(comparison_lines)
-        ax.text(0.05, 0.9, comparison_text, ha='left', va='top', fontsize=11, 
+
+        # Fixed layout, single template (see _create_single_benchmark_metrics_page)
+        m = self.metrics
+        bar = "=" * 50
+        comparison_text = (
+            f"STRATEGY vs BENCHMARK\n{bar}\n"
+            f"Strategy Return: {m.get('Total Return (%)', 0):.2f}%\n"
+            f"Benchmark Return: {m.get('Benchmark Total Return (%)', 0):.2f}%\n"
+            f"Alpha: {m.get('Alpha (%)', 0):.2f}%\n"
+            f"\n"
+            f"ANNUALIZED COMPARISON\n{bar}\n"
+            f"Strategy Ann. Return: {m.get('Annualized Return (%)', 0):.2f}%\n"
+            f"Benchmark Ann. Return: {m.get('Benchmark Annualized Return (%)', 0):.2f}%\n"
+            f"\n"
+            f"RISK COMPARISON\n{bar}\n"
+            f"Strategy Volatility: {m.get('Annualized Volatility (%)', 0):.2f}%\n"
+            f"Benchmark Volatility: {m.get('Benchmark Volatility (%)', 0):.2f}%\n"
+            f"Strategy Max DD: {m.get('Maximum Drawdown (%)', 0):.2f}%\n"
+            f"Benchmark Max DD: {m.get('Benchmark Max Drawdown (%)', 0):.2f}%\n"
+            f"\n"
+            f"RISK-ADJUSTED COMPARISON\n{bar}\n"
+            f"Strategy Sharpe: {m.get('Sharpe Ratio', 0):.2f}\n"
+            f"Benchmark Sharpe: {m.get('Benchmark Sharpe Ratio', 0):.2f}\n"
+            f"\n"
+            f"RELATIVE PERFORMANCE\n{bar}\n"
+            f"Beta: {m.get('Beta', 0):.2f}\n"
+            f"Tracking Error: {m.get('Tracking Error (%)', 0):.2f}%\n"
+            f"Information Ratio: {m.get('Information Ratio', 0):.2f}"
+        )
+        ax.text(0.05, 0.9, comparison_text, ha='left', va='top', fontsize=11,
                fontfamily='monospace', transform=ax.transAxes)
-        
+
         pdf.savefig(fig, bbox_inches='tight')
-        plt.close(fig)
-    
-    def _create_equity_plots_page(self, pdf: PdfPages):
+
+    def _create_equity_plots_page(self, pdf: 'PdfPages'):
         """Create equity curve plots page."""
+        import matplotlib.pyplot as plt
+
         # Equity curve
         fig = Visualizer.plot_equity_curve(self.result, title="Portfolio Equity Curve")
         pdf.savefig(fig, bbox_inches='tight')
@@ -500,8 +485,11 @@ class SummaryReport:
         except Exception as e:
             print(f"Could not generate comprehensive analysis plot: {e}")
     
-    def _create_signals_page(self, pdf: PdfPages):
+    def _create_signals_page(self, pdf: 'PdfPages'):
         """Create signals analysis page."""
+        import matplotlib.pyplot as plt
+        from matplotlib.figure import Figure
+
         try:
             # Get available symbols
             if self.result.market_data is not None:
@@ -516,149 +504,173 @@ class SummaryReport:
                     plt.close(fig)
             else:
                 # Create empty page with message
-                fig, ax = plt.subplots(figsize=(8.5, 11))
+                fig = Figure(figsize=(8.5, 11))
+                ax = fig.add_subplot(111)
                 ax.axis('off')
-                ax.text(0.5, 0.5, 'No signal data available for visualization', 
+                ax.text(0.5, 0.5, 'No signal data available for visualization',
                        ha='center', va='center', fontsize=16, transform=ax.transAxes)
                 pdf.savefig(fig, bbox_inches='tight')
-                plt.close(fig)
-                
+
         except Exception as e:
             print(f"Could not generate signals plot: {e}")
             # Create error page
-            fig, ax = plt.subplots(figsize=(8.5, 11))
+            fig = Figure(figsize=(8.5, 11))
+            ax = fig.add_subplot(111)
             ax.axis('off')
-            ax.text(0.5, 0.5, f'Error generating signals plot: {e}', 
+            ax.text(0.5, 0.5, f'Error generating signals plot: {e}',
                    ha='center', va='center', fontsize=12, transform=ax.transAxes)
             pdf.savefig(fig, bbox_inches='tight')
-            plt.close(fig)
     
-    def _create_drawdown_page(self, pdf: PdfPages):
+    def _create_drawdown_page(self, pdf: 'PdfPages'):
         """Create drawdown analysis page."""
+        import matplotlib.pyplot as plt
+
         fig = Visualizer.plot_drawdown(self.result)
         pdf.savefig(fig, bbox_inches='tight')
         plt.close(fig)
     
-    def _create_returns_page(self, pdf: PdfPages):
+    def _create_returns_page(self, pdf: 'PdfPages'):
         """Create returns distribution page."""
+        import matplotlib.pyplot as plt
+
         fig = Visualizer.plot_returns_distribution(self.result)
         pdf.savefig(fig, bbox_inches='tight')
         plt.close(fig)
     
-    def _create_monthly_heatmap_page(self, pdf: PdfPages):
+    def _create_monthly_heatmap_page(self, pdf: 'PdfPages'):
         """Create monthly returns heatmap page."""
+        import matplotlib.pyplot as plt
+
         fig = Visualizer.plot_monthly_returns_heatmap(self.result)
         pdf.savefig(fig, bbox_inches='tight')
         plt.close(fig)
     
-    def _create_order_history_page(self, pdf: PdfPages):
+    def _create_order_history_page(self, pdf: 'PdfPages', fig, ax):
         """Create order history page."""
         trades_df = self.result.get_trades_dataframe()
-        
+
         if trades_df.empty:
-            fig, ax = plt.subplots(figsize=(8.5, 11))
+            ax.clear()
             ax.axis('off')
-            ax.text(0.5, 0.5, 'No trades executed', ha='center', va='center', 
+            ax.text(0.5, 0.5, 'No trades executed', ha='center', va='center',
                    fontsize=16, transform=ax.transAxes)
             pdf.savefig(fig, bbox_inches='tight')
-            plt.close(fig)
             return
-        
+
+        # Format every column in one vectorized pass up front; the per-page
+        # loop below only slices the precomputed cell matrix
+        headers = ['Date', 'Symbol', 'Quantity', 'Price', 'Fees', 'Total Cost']
+        cells = np.column_stack([
+            trades_df.index.strftime('%Y-%m-%d').to_numpy(),
+            trades_df['Symbol'].to_numpy(dtype=object),
+            np.char.mod('%.0f', trades_df['Quantity'].to_numpy(dtype=np.float64)),
+            np.char.mod('$%.2f', trades_df['Price'].to_numpy(dtype=np.float64)),
+            np.char.mod('$%.2f', trades_df['Fees'].to_numpy(dtype=np.float64)),
+            np.char.mod('$%.2f', trades_df['Total_Cost'].to_numpy(dtype=np.float64)),
+        ])
+
         # Create multiple pages if needed for large trade history
         trades_per_page = 50
         num_pages = (len(trades_df) - 1) // trades_per_page + 1
-        
+
         for page in range(num_pages):
             start_idx = page * trades_per_page
             end_idx = min((page + 1) * trades_per_page, len(trades_df))
-            page_trades = trades_df.iloc[start_idx:end_idx]
-            
-            fig, ax = plt.subplots(figsize=(8.5, 11))
+
+            ax.clear()
             ax.axis('off')
-            
+
             title = f'Order History (Page {page + 1} of {num_pages})'
-            ax.text(0.5, 0.95, title, ha='center', va='top', 
+            ax.text(0.5, 0.95, title, ha='center', va='top',
                    fontsize=16, fontweight='bold')
-            
-            # Format trades table
-            table_data = []
-            table_data.append(['Date', 'Symbol', 'Quantity', 'Price', 'Fees', 'Total Cost'])
-            
-            for idx, (date, trade) in enumerate(page_trades.iterrows()):
-                table_data.append([
-                    date.strftime('%Y-%m-%d'),
-                    trade['Symbol'],
-                    f"{trade['Quantity']:.0f}",
-                    f"${trade['Price']:.2f}",
-                    f"${trade['Fees']:.2f}",
-                    f"${trade['Total_Cost']:.2f}"
-                ])
-            
-            # Create table
-            table = ax.table(cellText=table_data[1:], colLabels=table_data[0],
+
+            # Create table; header colors are set at construction so only the
+            # header text props need touching afterwards
+            table = ax.table(cellText=cells[start_idx:end_idx].tolist(),
+                           colLabels=headers,
+                           colColours=['#4CAF50'] * len(headers),
                            cellLoc='center', loc='center', bbox=[0.05, 0.1, 0.9, 0.8])
             table.auto_set_font_size(False)
             table.set_fontsize(8)
             table.scale(1, 2)
-            
+
             # Style header row
-            for i in range(len(table_data[0])):
-                table[(0, i)].set_facecolor('#4CAF50')
+            for i in range(len(headers)):
                 table[(0, i)].set_text_props(weight='bold', color='white')
-            
+
             pdf.savefig(fig, bbox_inches='tight')
-            plt.close(fig)
     
-    def _create_trade_analysis_page(self, pdf: PdfPages):
+    def _create_trade_analysis_page(self, pdf: 'PdfPages'):
         """Create trade analysis page."""
+        from matplotlib.figure import Figure
+
         trades_df = self.result.get_trades_dataframe()
-        
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(11, 8.5))
+
+        fig = Figure(figsize=(11, 8.5))
+        ((ax1, ax2), (ax3, ax4)) = fig.subplots(2, 2)
         fig.suptitle('Trade Analysis', fontsize=16, fontweight='bold')
-        
+
         if trades_df.empty:
             for ax in [ax1, ax2, ax3, ax4]:
                 ax.text(0.5, 0.5, 'No trades to analyze', ha='center', va='center')
                 ax.set_xticks([])
                 ax.set_yticks([])
             pdf.savefig(fig, bbox_inches='tight')
-            plt.close(fig)
             return
         
+        # Pull the columns out once as raw arrays; everything below is
+        # computed in numpy
+        quantities = trades_df['Quantity'].to_numpy(dtype=np.float64)
+        total_costs = trades_df['Total_Cost'].to_numpy(dtype=np.float64)
+
         # Trade size distribution
-        ax1.hist(trades_df['Quantity'], bins=20, alpha=0.7, color='blue')
+        counts, bin_edges = np.histogram(quantities, bins=20)
+        ax1.bar(bin_edges[:-1], counts, width=np.diff(bin_edges), align='edge',
+               alpha=0.7, color='blue')
         ax1.set_title('Trade Size Distribution')
         ax1.set_xlabel('Quantity')
         ax1.set_ylabel('Frequency')
-        
+
         # Trade cost distribution
-        ax2.hist(trades_df['Total_Cost'], bins=20, alpha=0.7, color='green')
+        counts, bin_edges = np.histogram(total_costs, bins=20)
+        ax2.bar(bin_edges[:-1], counts, width=np.diff(bin_edges), align='edge',
+               alpha=0.7, color='green')
         ax2.set_title('Trade Cost Distribution')
         ax2.set_xlabel('Total Cost ($)')
         ax2.set_ylabel('Frequency')
-        
-        # Trades by symbol
-        symbol_counts = trades_df['Symbol'].value_counts()
-        if len(symbol_counts) <= 10:
-            ax3.bar(symbol_counts.index, symbol_counts.values, color='orange')
+
+        # Trades by symbol, most traded first
+        symbols, symbol_counts = np.unique(
+            trades_df['Symbol'].to_numpy(), return_counts=True)
+        order = np.argsort(-symbol_counts, kind='stable')
+        symbols, symbol_counts = symbols[order], symbol_counts[order]
+        if len(symbols) <= 10:
+            ax3.bar(symbols, symbol_counts, color='orange')
             ax3.set_title('Trades by Symbol')
             ax3.set_xlabel('Symbol')
             ax3.set_ylabel('Number of Trades')
             ax3.tick_params(axis='x', rotation=45)
         else:
-            ax3.pie(symbol_counts.head(10).values, labels=symbol_counts.head(10).index, autopct='%1.1f%%')
+            ax3.pie(symbol_counts[:10], labels=symbols[:10], autopct='%1.1f%%')
             ax3.set_title('Top 10 Symbols by Trade Count')
-        
-        # Trades over time
-        monthly_trades = trades_df.resample('M').size()
-        ax4.plot(monthly_trades.index, monthly_trades.values, marker='o', color='red')
+
+        # Trades over time: bucket trade dates by month with a bincount
+        # (months without trades stay at zero, like the old resample did)
+        ym = (trades_df.index.year.to_numpy() * 12
+              + trades_df.index.month.to_numpy() - 1)
+        monthly_counts = np.bincount(ym - ym.min(),
+                                     minlength=ym.max() - ym.min() + 1)
+        all_ym = np.arange(ym.min(), ym.max() + 1)
+        month_ends = pd.to_datetime(
+            {'year': all_ym // 12, 'month': all_ym % 12 + 1, 'day': 1}
+        ) + pd.offsets.MonthEnd(0)
+        ax4.plot(month_ends, monthly_counts, marker='o', color='red')
         ax4.set_title('Trades Over Time')
         ax4.set_xlabel('Date')
         ax4.set_ylabel('Number of Trades')
         ax4.tick_params(axis='x', rotation=45)
         
-        plt.tight_layout()
+        fig.tight_layout()
         pdf.savefig(fig, bbox_inches='tight')
-        plt.close(fig)
 
 
@@ -10,8 +10,8 @@ This script:
 """
 
 import sys
+import argparse
 from datetime import datetime, timedelta
-import matplotlib.pyplot as plt
 
 # Add the parent directory to the path to import qbt
 sys.path.append('..')
@@ -27,6 +27,11 @@ from qbt.engine.metrics import PerformanceMetrics
 from qbt.engine.viz import Visualizer
 from qbt.engine.summary import SummaryReport
 
+# One data source shared by every example function: all of them hit the
+# same on-disk parquet cache, so overlapping universe/date ranges are
+# downloaded at most once per cache TTL no matter how many examples run
+DATA_SOURCE = YFDataSource()
+
 
 def show_benchmark_options():
     """Display available benchmark options."""
@@ -38,7 +43,7 @@ def show_benchmark_options():
     print()
 
 
-def main():
+def main(show_plots=True):
     """Run the example backtest."""
     
     print("Quantitative Backtesting Framework - Example")
@@ -62,8 +67,8 @@ def main():
         # Initialize components
         print("Initializing components...")
         
-        # Data source
-        data_source = YFDataSource()
+        # Data source (module-level shared instance)
+        data_source = DATA_SOURCE
         
         # Signal generators
         ema_signal = EMASignal(short_period=12, long_period=26)
@@ -121,62 +126,69 @@ def main():
                 print("\nFirst 10 trades:")
                 print(trades_df.head(10).to_string())
             
-            # Create visualizations
-            print("\nGenerating visualizations...")
-            
-            # Comprehensive analysis plot
-            fig = Visualizer.plot_comprehensive_analysis(result)
-            plt.show()
-            
-            # Individual plots
-            fig_equity = Visualizer.plot_equity_curve(result)
-            plt.show()
-            
-            # Signal analysis plot
-            fig_signals = Visualizer.plot_signals(result)
-            plt.show()
-            
-            fig_drawdown = Visualizer.plot_drawdown(result)
-            plt.show()
-            
-            fig_returns = Visualizer.plot_returns_distribution(result)
-            plt.show()
-            
-            # Monthly returns heatmap (if enough data)
-            try:
-                fig_monthly = Visualizer.plot_monthly_returns_heatmap(result)
-                plt.show()
-            except Exception as e:
-                print(f"Could not generate monthly returns heatmap: {e}")
-            
-            # Generate PDF report
-            print("\nGenerating PDF report...")
-            try:
-                # Generate report (config is automatically included in result)
-                report = SummaryReport(result)
-                pdf_filename = report.generate_pdf()
-                print(f"PDF report saved as: {pdf_filename}")
-                
-            except Exception as e:
-                print(f"Error generating PDF report: {e}")
-                import traceback
-                traceback.print_exc()
-            
+            if show_plots:
+                _show_visualizations(result)
+
             print("\nBacktest completed successfully!")
-            
+
         else:
             print("No results to display. Check your data and date range.")
-    
+
     except Exception as e:
         print(f"Error running backtest: {e}")
         import traceback
         traceback.print_exc()
         return 1
-    
+
     return 0
 
 
-def multiple_benchmarks_example():
+def _show_visualizations(result):
+    """Build and display all example figures plus the PDF report."""
+    # Deferred so --no-plot runs never pay the matplotlib import cost
+    import matplotlib.pyplot as plt
+
+    print("\nGenerating visualizations...")
+
+    # Build every figure first and hand control to one blocking
+    # plt.show() at the end: all windows open together instead of
+    # six sequential show/close round-trips, and matplotlib's font
+    # and renderer caches are reused across the figures
+    fig = Visualizer.plot_comprehensive_analysis(result)
+
+    # Individual plots
+    fig_equity = Visualizer.plot_equity_curve(result)
+
+    # Signal analysis plot
+    fig_signals = Visualizer.plot_signals(result)
+
+    fig_drawdown = Visualizer.plot_drawdown(result)
+
+    fig_returns = Visualizer.plot_returns_distribution(result)
+
+    # Monthly returns heatmap (if enough data)
+    try:
+        fig_monthly = Visualizer.plot_monthly_returns_heatmap(result)
+    except Exception as e:
+        print(f"Could not generate monthly returns heatmap: {e}")
+
+    plt.show()
+
+    # Generate PDF report
+    print("\nGenerating PDF report...")
+    try:
+        # Generate report (config is automatically included in result)
+        report = SummaryReport(result)
+        pdf_filename = report.generate_pdf()
+        print(f"PDF report saved as: {pdf_filename}")
+
+    except Exception as e:
+        print(f"Error generating PDF report: {e}")
+        import traceback
+        traceback.print_exc()
+
+
+def multiple_benchmarks_example(show_plots=True):
     """Run example with multiple benchmarks including market indices and custom strategies."""
     
     print("\nMultiple Benchmarks Example")
@@ -191,7 +203,7 @@ def multiple_benchmarks_example():
     
     try:
         # Components
-        data_source = YFDataSource()
+        data_source = DATA_SOURCE
         ema_signal = EMASignal(short_period=10, long_period=30)
         strategy = CrossOverStrategy(position_size=0.4)
         broker = SimpleBroker(commission=0.001, slippage=0.0005)
@@ -247,9 +259,11 @@ def multiple_benchmarks_example():
                     print(f"  Beta: {metrics.get('Beta', 0):.2f}")
                     print(f"  Information Ratio: {metrics.get('Information Ratio', 0):.2f}")
             
-            # Generate comprehensive plot with multiple benchmarks
-            fig = Visualizer.plot_comprehensive_analysis(result)
-            plt.show()
+            if show_plots:
+                # Generate comprehensive plot with multiple benchmarks
+                import matplotlib.pyplot as plt
+                fig = Visualizer.plot_comprehensive_analysis(result)
+                plt.show()
             
         else:
             print("No results generated.")
@@ -262,50 +276,50 @@ def multiple_benchmarks_example():
 
 def benchmark_comparison_example():
     """Run example comparing different benchmarks."""
-    
+
     print("\nBenchmark Comparison Example")
     print("=" * 40)
     print("Comparing strategy against S&P 500 and NASDAQ 100 benchmarks")
-    
+
     # Configuration
     universe = ["AAPL", "MSFT"]
     start_date = datetime(2022, 1, 1)
     end_date = datetime(2023, 12, 31)
     initial_cash = 50000.0
-    
+
     benchmarks_to_test = ["SP500", "NASDAQ100"]
     results = {}
-    
-    for benchmark_type in benchmarks_to_test:
-        print(f"\nRunning with {benchmark_type} benchmark...")
-        
-        try:
-            # Components
-            data_source = YFDataSource()
-            ema_signal = EMASignal(short_period=10, long_period=30)
-            strategy = CrossOverStrategy(position_size=0.5)
-            broker = SimpleBroker(commission=0.001, slippage=0.0005)
-            
-            # Backtester
-            backtester = Backtester(
-                data_source=data_source,
-                signal_generators=[ema_signal],
-                strategy=strategy,
-                broker=broker,
-                initial_cash=initial_cash,
-                benchmark_type=benchmark_type
-            )
-            
-            # Run backtest
-            result = backtester.run(
-                universe=universe,
-                start_date=start_date,
-                end_date=end_date,
-                strategy_name=f"EMA Strategy vs {benchmark_type}"
-            )
-            
-            if result.equity_curve:
-                metrics = PerformanceMetrics.calculate_metrics(result)
+
+    # The strategy's signals and equity curve don't depend on the chosen
+    # benchmark, so run the backtest once with every benchmark attached
+    # and derive the per-benchmark comparisons afterwards
+    try:
+        ema_signal = EMASignal(short_period=10, long_period=30)
+        strategy = CrossOverStrategy(position_size=0.5)
+        broker = SimpleBroker(commission=0.001, slippage=0.0005)
+
+        backtester = Backtester(
+            data_source=DATA_SOURCE,
+            signal_generators=[ema_signal],
+            strategy=strategy,
+            broker=broker,
+            initial_cash=initial_cash,
+            benchmark_types=benchmarks_to_test
+        )
+
+        result = backtester.run(
+            universe=universe,
+            start_date=start_date,
+            end_date=end_date,
+            strategy_name="EMA Strategy benchmark comparison"
+        )
+
+        if result.equity_curve:
+            all_metrics = PerformanceMetrics.calculate_all_benchmark_metrics(result)
+            for benchmark_type in benchmarks_to_test:
+                metrics = all_metrics.get(f'Strategy vs {benchmark_type}')
+                if metrics is None:
+                    continue
                 results[benchmark_type] = {
                     'strategy_return': metrics['Total Return (%)'],
                     'benchmark_return': metrics.get('Benchmark Total Return (%)', 0),
@@ -313,13 +327,14 @@ def benchmark_comparison_example():
                     'sharpe': metrics['Sharpe Ratio'],
                     'max_drawdown': metrics['Maximum Drawdown (%)']
                 }
-                
+
+                print(f"\n{benchmark_type} benchmark:")
                 print(f"Strategy Return: {metrics['Total Return (%)']:.2f}%")
                 print(f"Benchmark Return: {metrics.get('Benchmark Total Return (%)', 0):.2f}%")
                 print(f"Alpha: {metrics.get('Alpha (%)', 0):.2f}%")
-                
-        except Exception as e:
-            print(f"Error with {benchmark_type} benchmark: {e}")
+
+    except Exception as e:
+        print(f"Benchmark comparison failed: {e}")
     
     # Summary comparison
     if results:
@@ -335,7 +350,7 @@ def benchmark_comparison_example():
             print(f"  Max Drawdown: {metrics['max_drawdown']:.2f}%")
 
 
-def simple_example():
+def simple_example(show_plots=True):
     """Run a simpler example with just one stock for testing."""
     
     print("\nRunning Simple Example (AAPL only)")
@@ -349,7 +364,7 @@ def simple_example():
     
     try:
         # Initialize components
-        data_source = YFDataSource()
+        data_source = DATA_SOURCE
         ema_signal = EMASignal(short_period=5, long_period=20)  # Faster signals
         strategy = CrossOverStrategy(position_size=0.8)  # More aggressive
         broker = SimpleBroker(commission=0.0005, slippage=0.0002)  # Lower costs
@@ -382,23 +397,22 @@ def simple_example():
             print(f"Sharpe Ratio: {metrics['Sharpe Ratio']:.2f}")
             print(f"Total Trades: {metrics['Total Trades']}")
             
-            # Simple equity plot
-            fig = Visualizer.plot_equity_curve(result, title="Simple AAPL Backtest")
-            plt.show()
-            
-            # Simple signals plot
-            fig_signals = Visualizer.plot_signals(result, title="AAPL Trading Signals")
-            plt.show()
-            
-            # Generate simple PDF report
-            print("\nGenerating PDF report...")
-            try:
-                report = SummaryReport(result)
-                pdf_filename = report.generate_pdf("simple_backtest_report.pdf")
-                print(f"Simple PDF report saved as: {pdf_filename}")
-                
-            except Exception as e:
-                print(f"Error generating PDF report: {e}")
+            if show_plots:
+                # Simple equity and signals plots, shown together
+                import matplotlib.pyplot as plt
+                fig = Visualizer.plot_equity_curve(result, title="Simple AAPL Backtest")
+                fig_signals = Visualizer.plot_signals(result, title="AAPL Trading Signals")
+                plt.show()
+
+                # Generate simple PDF report
+                print("\nGenerating PDF report...")
+                try:
+                    report = SummaryReport(result)
+                    pdf_filename = report.generate_pdf("simple_backtest_report.pdf")
+                    print(f"Simple PDF report saved as: {pdf_filename}")
+
+                except Exception as e:
+                    print(f"Error generating PDF report: {e}")
             
         else:
             print("No results generated.")
@@ -408,35 +422,45 @@ def simple_example():
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--no-plot", action="store_true",
+        help="headless mode: skip all figures and PDF reports (matplotlib "
+             "is never imported), useful for perf/regression runs"
+    )
+    args = parser.parse_args()
+    show_plots = not args.no_plot
+
     # Check if required packages are available
     try:
         import yfinance
         import pandas
         import numpy
-        import matplotlib
-        from scipy import stats
+        if show_plots:
+            import matplotlib
+            from scipy import stats
     except ImportError as e:
         print(f"Missing required package: {e}")
         print("Please install required packages:")
         print("pip install yfinance pandas numpy matplotlib scipy")
         sys.exit(1)
-    
+
     # Run main example
-    exit_code = main()
-    
+    exit_code = main(show_plots=show_plots)
+
     # Optionally run simple example
     user_input = input("\nRun simple example too? (y/n): ").lower().strip()
     if user_input in ['y', 'yes']:
-        simple_example()
-    
+        simple_example(show_plots=show_plots)
+
     # Optionally run multiple benchmarks example
     user_input = input("\nRun multiple benchmarks example? (y/n): ").lower().strip()
     if user_input in ['y', 'yes']:
-        multiple_benchmarks_example()
-    
+        multiple_benchmarks_example(show_plots=show_plots)
+
     # Optionally run benchmark comparison example
     user_input = input("\nRun benchmark comparison example? (y/n): ").lower().strip()
     if user_input in ['y', 'yes']:
         benchmark_comparison_example()
-    
+
     sys.exit(exit_code)
\ No newline at end of file
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from typing import List, Dict, Mapping
 from datetime import datetime
 import pandas as pd
 from ..engine.state import Order, Fill, PortfolioState
@@ -12,7 +12,7 @@ class Broker(ABC):
     def execute(
         self,
         orders: List[Order],
-        prices_today: Dict[str, float],
+        prices_today: Mapping[str, float],
         state: PortfolioState,
         current_date: datetime
     ) -> List[Fill]:
@@ -21,7 +21,8 @@ class Broker(ABC):
         
         Args:
             orders: List of orders to execute
-            prices_today: Current market prices by symbol
+            prices_today: Current market prices by symbol (dict or
+                PriceRowView over the close matrix row)
             state: Current portfolio state
             current_date: Current trading date
             
@@ -1,14 +1,16 @@
-from typing import List, Dict
+from typing import List, Dict, Mapping
 from datetime import datetime
+import numpy as np
 from .base import Broker
 from ..engine.state import Order, Fill, PortfolioState
+from ..engine._kernels import execute_orders
 
 
 class SimpleBroker(Broker):
     """
     Simple broker implementation with market orders, fees, and slippage.
     """
-    
+
     def __init__(
         self,
         commission: float = 0.001,  # 0.1% commission
@@ -16,90 +18,153 @@ class SimpleBroker(Broker):
     ):
         """
         Initialize simple broker.
-        
+
         Args:
             commission: Commission rate (fraction of trade value)
             slippage: Slippage rate (fraction of price)
         """
         self.commission = commission
         self.slippage = slippage
-    
+        # Scratch buffers reused across bars (grown on demand) so execute()
+        # allocates no arrays on the hot path; only Fill objects for
+        # accepted orders are created per bar
+        self._capacity = 0
+        self._qty = self._price = self._sym_idx = None
+        self._filled = self._fill_qty = self._fill_price = None
+        self._fill_fees = self._fill_slip = None
+        self._positions = np.empty(0, dtype=np.float64)
+
+    def _ensure_capacity(self, n: int):
+        """Grow the per-order scratch buffers (doubling) to hold n rows."""
+        if n <= self._capacity:
+            return
+        capacity = max(self._capacity * 2, n, 16)
+        self._qty = np.empty(capacity, dtype=np.float64)
+        self._price = np.empty(capacity, dtype=np.float64)
+        self._sym_idx = np.empty(capacity, dtype=np.int64)
+        self._filled = np.empty(capacity, dtype=np.bool_)
+        self._fill_qty = np.empty(capacity, dtype=np.float64)
+        self._fill_price = np.empty(capacity, dtype=np.float64)
+        self._fill_fees = np.empty(capacity, dtype=np.float64)
+        self._fill_slip = np.empty(capacity, dtype=np.float64)
+        self._capacity = capacity
+
     def execute(
         self,
         orders: List[Order],
-        prices_today: Dict[str, float],
+        prices_today: Mapping[str, float],
         state: PortfolioState,
         current_date: datetime
     ) -> List[Fill]:
         """
         Execute market orders with fees and slippage.
-        
+
+        The slippage/fee arithmetic and the sequential cash/position
+        reconciliation both run inside the compiled ``execute_orders``
+        kernel; this method only marshals orders into flat arrays and
+        materializes Fill objects for the accepted rows.
+
         Args:
             orders: List of orders to execute
-            prices_today: Current market prices by symbol
+            prices_today: Current market prices by symbol (dict or
+                PriceRowView over the close matrix row)
             state: Current portfolio state
             current_date: Current trading date
-            
+
         Returns:
             List of executed fills
         """
+        # Prefilter no-ops before any marshaling: zero-quantity orders and
+        # symbols without a positive price today can never fill, so they
+        # don't deserve a slot in the kernel arrays
+        orders = [
+            order for order in orders
+            if order.quantity != 0
+            and prices_today.get(order.symbol, 0.0) > 0.0
+        ]
+        n = len(orders)
+        if n == 0:
+            return []
+        self._ensure_capacity(n)
+        quantities = self._qty[:n]
+        prices = self._price[:n]
+        sym_idx = self._sym_idx[:n]
+
+        # Single marshaling pass: quantities, prices (missing symbols get
+        # 0.0 and are dropped by the kernel's price check) and a dense
+        # integer symbol index so the kernel can track positions in a flat
+        # array (duplicate symbols in one batch see each other's fills).
+        # When the state has symbols bound (the backtester always does),
+        # its stable universe index is reused; otherwise a local index is
+        # built for this batch.
+        positions = None
+        if state.symbol_index is not None:
+            bound_index = state.symbol_index
+            qty_vec = state.qty_vec
+            if len(bound_index) > len(self._positions):
+                self._positions = np.empty(
+                    max(len(self._positions) * 2, len(bound_index), 16),
+                    dtype=np.float64
+                )
+            positions = self._positions[:len(bound_index)]
+            try:
+                for i, order in enumerate(orders):
+                    quantities[i] = order.quantity
+                    prices[i] = prices_today.get(order.symbol, 0.0)
+                    idx = bound_index[order.symbol]
+                    sym_idx[i] = idx
+                    # Copy, don't alias: update_position below keeps
+                    # qty_vec and the positions dict in sync itself
+                    positions[idx] = qty_vec[idx]
+            except KeyError:
+                # An order for a symbol outside the bound universe; fall
+                # back to a per-batch index
+                positions = None
+        if positions is None:
+            symbol_index: Dict[str, int] = {}
+            symbols: List[str] = []
+            for i, order in enumerate(orders):
+                quantities[i] = order.quantity
+                prices[i] = prices_today.get(order.symbol, 0.0)
+                idx = symbol_index.get(order.symbol)
+                if idx is None:
+                    idx = len(symbols)
+                    symbol_index[order.symbol] = idx
+                    symbols.append(order.symbol)
+                sym_idx[i] = idx
+            if len(symbols) > len(self._positions):
+                self._positions = np.empty(
+                    max(len(self._positions) * 2, len(symbols), 16),
+                    dtype=np.float64
+                )
+            positions = self._positions[:len(symbols)]
+            for idx, symbol in enumerate(symbols):
+                positions[idx] = state.get_position(symbol)
+
+        filled = self._filled[:n]
+        fill_qty = self._fill_qty[:n]
+        fill_price = self._fill_price[:n]
+        fill_fees = self._fill_fees[:n]
+        fill_slip = self._fill_slip[:n]
+        new_cash = execute_orders(
+            quantities, prices, sym_idx, positions,
+            float(state.cash), self.commission, self.slippage,
+            filled, fill_qty, fill_price, fill_fees, fill_slip
+        )
+
         fills = []
-        
-        for order in orders:
-            if order.symbol not in prices_today:
-                continue
-                
-            price = prices_today[order.symbol]
-            if price <= 0:
+        for i, order in enumerate(orders):
+            if not filled[i]:
                 continue
-            
-            # Apply slippage (negative for buys, positive for sells)
-            slippage_amount = price * self.slippage * (1 if order.quantity > 0 else -1)
-            execution_price = price + slippage_amount
-            
-            # Calculate fees
-            trade_value = abs(order.quantity) * execution_price
-            fees = trade_value * self.commission
-            
-            # Check if we have enough cash for buy orders
-            if order.quantity > 0:  # Buy order
-                total_cost = trade_value + fees + abs(order.quantity) * abs(slippage_amount)
-                if total_cost > state.cash:
-                    # Adjust order size to available cash
-                    max_shares = int(state.cash / (execution_price + fees/abs(order.quantity) + abs(slippage_amount)))
-                    if max_shares <= 0:
-                        continue
-                    order.quantity = max_shares
-                    trade_value = order.quantity * execution_price
-                    fees = trade_value * self.commission
-            
-            # Check if we have enough shares for sell orders
-            elif order.quantity < 0:  # Sell order
-                current_position = state.get_position(order.symbol)
-                max_sell = -current_position
-                if order.quantity < max_sell:
-                    order.quantity = max_sell
-                
-                if order.quantity >= 0:  # Can't sell what we don't have
-                    continue
-            
-            # Create fill
-            fill = Fill(
-                symbol=order.symbol,
-                quantity=order.quantity,
-                price=execution_price,
-                fees=fees,
-                slippage=abs(order.quantity) * abs(slippage_amount),
-                timestamp=current_date
-            )
-            
-            # Update portfolio state
-            if order.quantity > 0:  # Buy
-                state.cash -= (trade_value + fees + fill.slippage)
-            else:  # Sell
-                state.cash += (trade_value - fees - fill.slippage)
-            
+            # The kernel may have clipped/clamped the quantity; Fill is
+            # built positionally (symbol, quantity, price, fees, slippage,
+            # timestamp) to skip kwargs parsing on the hot path
+            order.quantity = int(fill_qty[i])
+            fills.append(Fill(
+                order.symbol, order.quantity, fill_price[i],
+                fill_fees[i], fill_slip[i], current_date
+            ))
             state.update_position(order.symbol, order.quantity)
-            fills.append(fill)
-        
-        return fills
\ No newline at end of file
+
+        state.cash = new_cash
+        return fills
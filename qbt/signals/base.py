@@ -1,19 +1,103 @@
 from abc import ABC, abstractmethod
+from typing import Dict, List
+import numpy as np
 import pandas as pd
 
 
 class SignalGenerator(ABC):
     """Abstract base class for signal generators."""
-    
+
     @abstractmethod
     def transform(self, prices_df: pd.DataFrame) -> pd.DataFrame:
         """
         Add trading signals to the price DataFrame.
-        
+
         Args:
             prices_df: DataFrame with OHLCV data
-            
+
         Returns:
             DataFrame with additional signal columns
         """
-        pass
\ No newline at end of file
+        pass
+
+    def transform_arrays(
+        self,
+        index: pd.Index,
+        symbols: List[str],
+        fields: Dict[str, np.ndarray]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Compute signal columns from dense per-field matrices.
+
+        NumPy contract for subclasses: ``fields`` maps a field name
+        ('Close', ...) to a (n_dates, n_symbols) array aligned to
+        ``index``/``symbols``, with NaN where a symbol has no bar.
+        Implementations return only the new signal fields in the same
+        layout. Overriding this is the fastest integration point — no
+        pandas objects are built on the signal path at all. The default
+        round-trips through wide_transform() for compatibility.
+
+        Args:
+            index: Date index the field rows are aligned to
+            symbols: Symbol order the field columns are aligned to
+            fields: Field name -> (n_dates, n_symbols) value matrix
+
+        Returns:
+            New signal field name -> (n_dates, n_symbols) matrix
+        """
+        wide_df = pd.concat(
+            {field: pd.DataFrame(matrix, index=index, columns=symbols)
+             for field, matrix in fields.items()},
+            axis=1
+        )
+        out = self.wide_transform(wide_df)
+        return {
+            field: out[field].reindex(columns=symbols).to_numpy()
+            for field in out.columns.get_level_values(0).unique()
+            if field not in fields
+        }
+
+    def wide_transform(self, wide_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Add trading signals to a wide-form price DataFrame.
+
+        Fast path for the engine: the frame is indexed by Date with
+        (Field, Symbol) columns, so indicator math runs as one vectorized
+        pass over all symbols. When the subclass implements
+        transform_arrays(), the field matrices are handed to it directly;
+        otherwise this default round-trips through transform() for
+        compatibility.
+
+        Args:
+            wide_df: DataFrame indexed by Date with (Field, Symbol) columns
+
+        Returns:
+            Wide DataFrame with additional signal columns
+        """
+        if type(self).transform_arrays is not SignalGenerator.transform_arrays:
+            symbol_cols = None
+            fields = {}
+            for field in wide_df.columns.get_level_values(0).unique():
+                block = wide_df[field]
+                if symbol_cols is None:
+                    # Keep the original column Index so its level name
+                    # ('Symbol') survives into the new signal columns
+                    symbol_cols = block.columns
+                else:
+                    block = block.reindex(columns=symbol_cols)
+                fields[field] = block.to_numpy()
+            new_fields = self.transform_arrays(
+                wide_df.index, list(symbol_cols), fields
+            )
+            new_cols = pd.concat(
+                {name: pd.DataFrame(matrix, index=wide_df.index,
+                                    columns=symbol_cols)
+                 for name, matrix in new_fields.items()},
+                axis=1
+            )
+            return pd.concat([wide_df, new_cols], axis=1)
+
+        long_df = wide_df.stack(level=-1)
+        if 'Close' in long_df.columns:
+            long_df = long_df[long_df['Close'].notna()]
+        return self.transform(long_df).unstack('Symbol')
@@ -1,14 +1,17 @@
+from typing import Dict, List
+import numpy as np
 import pandas as pd
 from .base import SignalGenerator
+from ..engine._kernels import ewma
 
 
 class EMASignal(SignalGenerator):
     """Exponential Moving Average signal generator."""
-    
+
     def __init__(self, short_period: int = 12, long_period: int = 26, column: str = 'Close'):
         """
         Initialize EMA signal generator.
-        
+
         Args:
             short_period: Short EMA period
             long_period: Long EMA period
@@ -17,45 +20,77 @@ class EMASignal(SignalGenerator):
         self.short_period = short_period
         self.long_period = long_period
         self.column = column
-    
+
     def transform(self, prices_df: pd.DataFrame) -> pd.DataFrame:
         """
         Add EMA signals to the price DataFrame.
-        
+
         Args:
             prices_df: DataFrame with OHLCV data
-            
+
         Returns:
             DataFrame with additional EMA signal columns
         """
-        result_df = prices_df.copy()
-        
-        # Get unique symbols
         if isinstance(prices_df.index, pd.MultiIndex):
-            symbols = prices_df.index.get_level_values('Symbol').unique()
-            
-            for symbol in symbols:
-                symbol_data = prices_df.loc[pd.IndexSlice[:, symbol], :]
-                
-                # Calculate EMAs
-                short_ema = symbol_data[self.column].ewm(span=self.short_period).mean()
-                long_ema = symbol_data[self.column].ewm(span=self.long_period).mean()
-                
-                # Add to result
-                result_df.loc[pd.IndexSlice[:, symbol], f'EMA_{self.short_period}'] = short_ema.values
-                result_df.loc[pd.IndexSlice[:, symbol], f'EMA_{self.long_period}'] = long_ema.values
-                
-                # Generate signals
-                result_df.loc[pd.IndexSlice[:, symbol], 'EMA_Signal'] = (
-                    (short_ema > long_ema).astype(int).values
-                )
+            # One grouped EWM dispatch per span instead of a per-symbol
+            # .loc[IndexSlice] slice-and-write loop; transform() keeps the
+            # result aligned to the original row order
+            grouped = prices_df.groupby(
+                level='Symbol', sort=False, group_keys=False
+            )[self.column]
+            short_ema = grouped.transform(
+                lambda s: s.ewm(span=self.short_period).mean()
+            )
+            long_ema = grouped.transform(
+                lambda s: s.ewm(span=self.long_period).mean()
+            )
         else:
             # Single symbol case
             short_ema = prices_df[self.column].ewm(span=self.short_period).mean()
             long_ema = prices_df[self.column].ewm(span=self.long_period).mean()
-            
-            result_df[f'EMA_{self.short_period}'] = short_ema
-            result_df[f'EMA_{self.long_period}'] = long_ema
-            result_df['EMA_Signal'] = (short_ema > long_ema).astype(int)
-        
-        return result_df
\ No newline at end of file
+
+        # Assemble the new columns once and concat, rather than copying
+        # the whole frame first; under copy-on-write the existing OHLCV
+        # blocks are referenced, not duplicated
+        new_df = pd.DataFrame({
+            f'EMA_{self.short_period}': short_ema,
+            f'EMA_{self.long_period}': long_ema,
+            'EMA_Signal': (
+                short_ema.to_numpy() > long_ema.to_numpy()
+            ).astype(np.int8),
+        }, index=prices_df.index)
+        return pd.concat([prices_df, new_df], axis=1)
+
+    def transform_arrays(
+        self,
+        index: pd.Index,
+        symbols: List[str],
+        fields: Dict[str, np.ndarray]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Compute EMA signal matrices for all symbols with the JIT kernel.
+
+        Runs the scalar EWMA recurrence per column in compiled code (one
+        pass, no pandas objects) with the same adjust/ignore_na semantics
+        as the ewm-based path.
+
+        Args:
+            index: Date index the field rows are aligned to
+            symbols: Symbol order the field columns are aligned to
+            fields: Field name -> (n_dates, n_symbols) value matrix
+
+        Returns:
+            Short/long EMA and crossover signal matrices
+        """
+        # pandas ewm also aggregates in float64 regardless of input dtype;
+        # the crossover compare runs on the full-precision values, then
+        # the stored indicator matrices are narrowed to float32 (plot/
+        # report precision) to halve their footprint downstream
+        close = np.ascontiguousarray(fields[self.column], dtype=np.float64)
+        short_ema = ewma(close, 2.0 / (self.short_period + 1.0))
+        long_ema = ewma(close, 2.0 / (self.long_period + 1.0))
+        return {
+            f'EMA_{self.short_period}': short_ema.astype(np.float32),
+            f'EMA_{self.long_period}': long_ema.astype(np.float32),
+            'EMA_Signal': (short_ema > long_ema).astype(np.int8),
+        }
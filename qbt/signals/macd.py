@@ -1,5 +1,8 @@
+from typing import Dict, List
+import numpy as np
 import pandas as pd
 from .base import SignalGenerator
+from ..engine._kernels import macd
 
 
 class MACDSignal(SignalGenerator):
@@ -36,42 +39,80 @@ class MACDSignal(SignalGenerator):
         Returns:
             DataFrame with additional MACD signal columns
         """
-        result_df = prices_df.copy()
-        
-        # Get unique symbols
         if isinstance(prices_df.index, pd.MultiIndex):
-            symbols = prices_df.index.get_level_values('Symbol').unique()
-            
-            for symbol in symbols:
-                symbol_data = prices_df.loc[pd.IndexSlice[:, symbol], :]
-                
-                # Calculate MACD components
-                fast_ema = symbol_data[self.column].ewm(span=self.fast_period).mean()
-                slow_ema = symbol_data[self.column].ewm(span=self.slow_period).mean()
-                macd_line = fast_ema - slow_ema
-                signal_line = macd_line.ewm(span=self.signal_period).mean()
-                histogram = macd_line - signal_line
-                
-                # Add to result
-                result_df.loc[pd.IndexSlice[:, symbol], 'MACD'] = macd_line.values
-                result_df.loc[pd.IndexSlice[:, symbol], 'MACD_Signal'] = signal_line.values
-                result_df.loc[pd.IndexSlice[:, symbol], 'MACD_Histogram'] = histogram.values
-                
-                # Generate trading signals (1 for bullish, 0 for bearish)
-                result_df.loc[pd.IndexSlice[:, symbol], 'MACD_Trading_Signal'] = (
-                    (macd_line > signal_line).astype(int).values
-                )
+            # One grouped EWM dispatch per span instead of a per-symbol
+            # .loc[IndexSlice] slice-and-write loop; transform() keeps the
+            # result aligned to the original row order
+            grouped = prices_df.groupby(
+                level='Symbol', sort=False, group_keys=False
+            )[self.column]
+            fast_ema = grouped.transform(
+                lambda s: s.ewm(span=self.fast_period).mean()
+            )
+            slow_ema = grouped.transform(
+                lambda s: s.ewm(span=self.slow_period).mean()
+            )
+            macd_line = fast_ema - slow_ema
+            signal_line = macd_line.groupby(
+                level='Symbol', sort=False, group_keys=False
+            ).transform(lambda s: s.ewm(span=self.signal_period).mean())
         else:
             # Single symbol case
             fast_ema = prices_df[self.column].ewm(span=self.fast_period).mean()
             slow_ema = prices_df[self.column].ewm(span=self.slow_period).mean()
             macd_line = fast_ema - slow_ema
             signal_line = macd_line.ewm(span=self.signal_period).mean()
-            histogram = macd_line - signal_line
-            
-            result_df['MACD'] = macd_line
-            result_df['MACD_Signal'] = signal_line
-            result_df['MACD_Histogram'] = histogram
-            result_df['MACD_Trading_Signal'] = (macd_line > signal_line).astype(int)
-        
-        return result_df
\ No newline at end of file
+
+        # Assemble the new columns once and concat, rather than copying
+        # the whole frame first; under copy-on-write the existing OHLCV
+        # blocks are referenced, not duplicated
+        new_df = pd.DataFrame({
+            'MACD': macd_line,
+            'MACD_Signal': signal_line,
+            'MACD_Histogram': macd_line - signal_line,
+            # Trading signal: 1 for bullish, 0 for bearish
+            'MACD_Trading_Signal': (
+                macd_line.to_numpy() > signal_line.to_numpy()
+            ).astype(np.int8),
+        }, index=prices_df.index)
+        return pd.concat([prices_df, new_df], axis=1)
+
+    def transform_arrays(
+        self,
+        index: pd.Index,
+        symbols: List[str],
+        fields: Dict[str, np.ndarray]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Compute MACD signal matrices for all symbols with the JIT kernel.
+
+        Runs the fast/slow/signal EWMA recurrences fused into one
+        compiled pass over the price matrix (no pandas objects, no
+        intermediate EMA buffers) with the same adjust/ignore_na
+        semantics as the ewm-based path.
+
+        Args:
+            index: Date index the field rows are aligned to
+            symbols: Symbol order the field columns are aligned to
+            fields: Field name -> (n_dates, n_symbols) value matrix
+
+        Returns:
+            MACD line/signal/histogram and trading signal matrices
+        """
+        # pandas ewm also aggregates in float64 regardless of input dtype;
+        # the bullish/bearish compare runs on the full-precision values,
+        # then the stored indicator matrices are narrowed to float32
+        # (plot/report precision) to halve their footprint downstream
+        close = np.ascontiguousarray(fields[self.column], dtype=np.float64)
+        macd_line, signal_line, histogram = macd(
+            close,
+            2.0 / (self.fast_period + 1.0),
+            2.0 / (self.slow_period + 1.0),
+            2.0 / (self.signal_period + 1.0),
+        )
+        return {
+            'MACD': macd_line.astype(np.float32),
+            'MACD_Signal': signal_line.astype(np.float32),
+            'MACD_Histogram': histogram.astype(np.float32),
+            'MACD_Trading_Signal': (macd_line > signal_line).astype(np.int8),
+        }
\ No newline at end of file
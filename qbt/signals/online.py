@@ -0,0 +1,159 @@
+"""Online (incremental) signal state for streaming / bar-by-bar use.
+
+The SignalGenerator classes precompute indicators over full history,
+which is the right shape for the backtester but an O(n^2) trap for live
+or event-driven loops that would otherwise recompute everything on each
+new bar. The classes here keep per-symbol smoothing state and fold one
+price row in per update, so a stream of n bars costs O(n) total. Their
+arithmetic mirrors the batch kernels exactly (the adjust=True weighted
+EWM of ewma / the Wilder recursion of wilder_rsi), so an online run
+produces the same values bar for bar as the precomputed matrices.
+"""
+from typing import Tuple
+import numpy as np
+
+
+class OnlineEMASignal:
+    """Incremental EMA crossover state over a fixed symbol universe.
+
+    Feed one price row per bar via update(); each call is a handful of
+    vectorized O(n_symbols) operations. NaN entries (no bar for that
+    symbol) leave its state untouched, matching the batch kernel's
+    ignore_na behavior; symbols stay NaN until their first observation.
+    """
+
+    def __init__(self, short_period: int, long_period: int, n_symbols: int):
+        """
+        Initialize online EMA state.
+
+        Args:
+            short_period: Short EMA period
+            long_period: Long EMA period
+            n_symbols: Size of the (fixed) symbol universe
+        """
+        self.short_alpha = 2.0 / (short_period + 1.0)
+        self.long_alpha = 2.0 / (long_period + 1.0)
+        self._short_avg = np.full(n_symbols, np.nan)
+        self._short_wt = np.ones(n_symbols)
+        self._long_avg = np.full(n_symbols, np.nan)
+        self._long_wt = np.ones(n_symbols)
+
+    @staticmethod
+    def _fold(avg: np.ndarray, wt: np.ndarray, prices: np.ndarray,
+              alpha: float):
+        """Apply one adjust=True weighted-EWM step in place."""
+        valid = prices == prices
+        seeded = avg == avg
+        update = valid & seeded
+        seed = valid & ~seeded
+        wt[update] *= 1.0 - alpha
+        # The batch kernel leaves the mean untouched when the new value
+        # equals it (only the weight moves); restore those lanes after
+        # the blended divide so results stay bit-identical
+        unchanged = update & (avg == prices)
+        previous_avg = avg[unchanged]
+        np.divide(wt * avg + prices, wt + 1.0, out=avg, where=update)
+        avg[unchanged] = previous_avg
+        wt[update] += 1.0
+        avg[seed] = prices[seed]
+
+    def update(
+        self, prices: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Fold in one bar of prices and return the current indicator rows.
+
+        Args:
+            prices: (n_symbols,) close prices for the bar (NaN = no data)
+
+        Returns:
+            Tuple of (short_ema, long_ema, signal) rows; signal is int8
+            with 1 where the short EMA is above the long EMA. The EMA
+            rows are live state — callers must copy before mutating.
+        """
+        self._fold(self._short_avg, self._short_wt, prices, self.short_alpha)
+        self._fold(self._long_avg, self._long_wt, prices, self.long_alpha)
+        signal = (self._short_avg > self._long_avg).astype(np.int8)
+        return self._short_avg, self._long_avg, signal
+
+
+class OnlineRSISignal:
+    """Incremental Wilder-RSI state over a fixed symbol universe.
+
+    Maintains the average gain/loss recursion of the wilder_rsi kernel
+    per symbol: the first ``period`` observed deltas seed the averages
+    with their simple mean, after which each update is
+    ``avg = ((period - 1) * avg + current) / period``. RSI is NaN until
+    a symbol's seed window is filled.
+    """
+
+    def __init__(self, period: int, n_symbols: int,
+                 overbought: float = 70, oversold: float = 30):
+        """
+        Initialize online RSI state.
+
+        Args:
+            period: Smoothing period (Wilder's classic choice is 14)
+            n_symbols: Size of the (fixed) symbol universe
+            overbought: Overbought threshold
+            oversold: Oversold threshold
+        """
+        self.period = period
+        self.overbought = overbought
+        self.oversold = oversold
+        self._prev = np.full(n_symbols, np.nan)
+        self._avg_gain = np.zeros(n_symbols)
+        self._avg_loss = np.zeros(n_symbols)
+        self._sum_gain = np.zeros(n_symbols)
+        self._sum_loss = np.zeros(n_symbols)
+        self._count = np.zeros(n_symbols, dtype=np.int64)
+
+    def update(self, prices: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Fold in one bar of prices and return the current RSI row.
+
+        Args:
+            prices: (n_symbols,) close prices for the bar (NaN = no data)
+
+        Returns:
+            Tuple of (rsi, signal) rows; signal is int8 with 1 for
+            oversold (buy), -1 for overbought (sell) and 0 for neutral
+        """
+        period = self.period
+        valid = prices == prices
+        observed = valid & (self._prev == self._prev)
+
+        delta = np.where(observed, prices - self._prev, 0.0)
+        gain = np.maximum(delta, 0.0)
+        loss = np.maximum(-delta, 0.0)
+
+        seeding = observed & (self._count < period)
+        self._sum_gain[seeding] += gain[seeding]
+        self._sum_loss[seeding] += loss[seeding]
+        self._count[seeding] += 1
+
+        # Symbols whose seed window just filled switch to the averages
+        just_seeded = seeding & (self._count == period)
+        self._avg_gain[just_seeded] = self._sum_gain[just_seeded] / period
+        self._avg_loss[just_seeded] = self._sum_loss[just_seeded] / period
+
+        smoothing = observed & ~seeding
+        self._avg_gain[smoothing] = (
+            (period - 1) * self._avg_gain[smoothing] + gain[smoothing]
+        ) / period
+        self._avg_loss[smoothing] = (
+            (period - 1) * self._avg_loss[smoothing] + loss[smoothing]
+        ) / period
+
+        self._prev[valid] = prices[valid]
+
+        # RSI is reported only on rows with an observed delta, like the
+        # batch kernel (NaN rows and the seed window stay NaN)
+        rsi = np.full(len(prices), np.nan)
+        ready = observed & (self._count >= period)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rs = self._avg_gain[ready] / self._avg_loss[ready]
+            rsi[ready] = 100.0 - 100.0 / (1.0 + rs)
+        signal = (
+            (rsi <= self.oversold).astype(np.int8)
+            - (rsi >= self.overbought).astype(np.int8)
+        )
+        return rsi, signal
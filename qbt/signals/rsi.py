@@ -1,6 +1,8 @@
+from typing import Dict, List, Union
 import pandas as pd
 import numpy as np
 from .base import SignalGenerator
+from ..engine._kernels import wilder_rsi
 
 
 class RSISignal(SignalGenerator):
@@ -27,15 +29,20 @@ class RSISignal(SignalGenerator):
         self.oversold = oversold
         self.column = column
     
-    def _calculate_rsi(self, prices: pd.Series) -> pd.Series:
-        """Calculate RSI for a price series."""
-        delta = prices.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=self.period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=self.period).mean()
-        
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-        return rsi
+    def _calculate_rsi(
+        self, prices: Union[pd.Series, pd.DataFrame]
+    ) -> Union[pd.Series, pd.DataFrame]:
+        """Calculate Wilder-smoothed RSI for a price series or wide frame.
+
+        Delegates to the compiled wilder_rsi kernel so the pandas paths
+        and the array path produce identical values.
+        """
+        values = prices.to_numpy(dtype=np.float64)
+        if values.ndim == 1:
+            rsi = wilder_rsi(values.reshape(-1, 1), self.period)
+            return pd.Series(rsi[:, 0], index=prices.index)
+        rsi = wilder_rsi(np.ascontiguousarray(values), self.period)
+        return pd.DataFrame(rsi, index=prices.index, columns=prices.columns)
     
     def transform(self, prices_df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -47,35 +54,60 @@ class RSISignal(SignalGenerator):
         Returns:
             DataFrame with additional RSI signal columns
         """
-        result_df = prices_df.copy()
-        
-        # Get unique symbols
         if isinstance(prices_df.index, pd.MultiIndex):
-            symbols = prices_df.index.get_level_values('Symbol').unique()
-            
-            for symbol in symbols:
-                symbol_data = prices_df.loc[pd.IndexSlice[:, symbol], :]
-                
-                # Calculate RSI
-                rsi = self._calculate_rsi(symbol_data[self.column])
-                
-                # Add to result
-                result_df.loc[pd.IndexSlice[:, symbol], 'RSI'] = rsi.values
-                
-                # Generate trading signals
-                # 1 for oversold (buy signal), -1 for overbought (sell signal), 0 for neutral
-                signals = np.where(rsi <= self.oversold, 1,
-                                 np.where(rsi >= self.overbought, -1, 0))
-                
-                result_df.loc[pd.IndexSlice[:, symbol], 'RSI_Signal'] = signals
+            # One grouped RSI pass per symbol group instead of a
+            # per-symbol .loc[IndexSlice] slice-and-write loop
+            rsi = prices_df.groupby(
+                level='Symbol', sort=False, group_keys=False
+            )[self.column].transform(self._calculate_rsi)
         else:
             # Single symbol case
             rsi = self._calculate_rsi(prices_df[self.column])
-            result_df['RSI'] = rsi
-            
-            # Generate trading signals
-            signals = np.where(rsi <= self.oversold, 1,
-                             np.where(rsi >= self.overbought, -1, 0))
-            result_df['RSI_Signal'] = signals
-        
-        return result_df
\ No newline at end of file
+
+        # Trading signals: 1 for oversold (buy), -1 for overbought (sell),
+        # 0 for neutral — one branchless arithmetic pass (NaN compares
+        # False on both sides, so missing RSI stays neutral)
+        rsi_arr = rsi.to_numpy()
+        signals = (
+            (rsi_arr <= self.oversold).astype(np.int8)
+            - (rsi_arr >= self.overbought).astype(np.int8)
+        )
+
+        # Assemble the new columns once and concat, rather than copying
+        # the whole frame first; under copy-on-write the existing OHLCV
+        # blocks are referenced, not duplicated
+        new_df = pd.DataFrame({'RSI': rsi, 'RSI_Signal': signals},
+                              index=prices_df.index)
+        return pd.concat([prices_df, new_df], axis=1)
+
+    def transform_arrays(
+        self,
+        index: pd.Index,
+        symbols: List[str],
+        fields: Dict[str, np.ndarray]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Compute RSI signal matrices for all symbols with the JIT kernel.
+
+        One fused compiled pass per column (delta, gain/loss split,
+        Wilder smoothing) instead of rolling-mean sweeps; no pandas
+        objects on the signal path.
+
+        Args:
+            index: Date index the field rows are aligned to
+            symbols: Symbol order the field columns are aligned to
+            fields: Field name -> (n_dates, n_symbols) value matrix
+
+        Returns:
+            RSI and tri-state trading signal matrices
+        """
+        close = np.ascontiguousarray(fields[self.column], dtype=np.float64)
+        rsi = wilder_rsi(close, self.period)
+        # Branchless tri-state signal; NaN RSI stays neutral. Thresholds
+        # are checked on the full-precision values before the stored RSI
+        # matrix is narrowed to float32
+        signals = (
+            (rsi <= self.oversold).astype(np.int8)
+            - (rsi >= self.overbought).astype(np.int8)
+        )
+        return {'RSI': rsi.astype(np.float32), 'RSI_Signal': signals}
\ No newline at end of file
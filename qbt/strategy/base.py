@@ -7,7 +7,18 @@ from ..engine.state import Order, PortfolioState
 
 class Strategy(ABC):
     """Abstract base class for trading strategies."""
-    
+
+    # Stateless strategies derive their target positions purely from the
+    # current bar's signals. Setting this to True lets the backtester skip
+    # the per-bar Python loop and run the whole accounting sweep in one
+    # vectorized pass; such strategies must implement compute_weights().
+    is_stateless = False
+
+    # Strategies that set this to True receive a BarView (NumPy row arrays,
+    # see qbt.engine.state.BarView) in on_bar instead of a per-bar
+    # DataFrame, avoiding any frame construction in the day loop.
+    accepts_bar_view = False
+
     @abstractmethod
     def on_bar(
         self,
@@ -26,4 +37,24 @@ class Strategy(ABC):
         Returns:
             List of orders to execute
         """
-        pass
\ No newline at end of file
+        pass
+
+    def compute_weights(self, prices_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Compute desired portfolio weights for the vectorized backtest mode.
+
+        Only used when is_stateless is True. The result must be a wide
+        DataFrame indexed by Date with one column per symbol, holding the
+        fraction of equity to allocate to each symbol on each bar
+        (NaN is treated as 0).
+
+        Args:
+            prices_df: Full market data with signals, MultiIndex [Date, Symbol]
+
+        Returns:
+            Wide (dates x symbols) DataFrame of target weights
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} declares is_stateless but does not "
+            "implement compute_weights()"
+        )
\ No newline at end of file
@@ -1,5 +1,6 @@
 from typing import List
 from datetime import datetime
+import numpy as np
 import pandas as pd
 from .base import Strategy
 from ..engine.state import Order, PortfolioState
@@ -51,33 +52,29 @@ class BuyAndHoldStrategy(Strategy):
         
         # Only buy on the first trading day
         if not self.initial_purchase_made:
-            available_symbols = slice_df.index.tolist()
-            if not available_symbols:
+            if len(slice_df.index) == 0:
                 return orders
-            
+
             # Use equal weight allocation
-            if self.allocation_method == "equal_weight":
-                allocation_per_symbol = 1.0 / len(available_symbols)
-                
-                for symbol in available_symbols:
-                    if 'Close' in slice_df.columns and not pd.isna(slice_df.loc[symbol, 'Close']):
-                        price = slice_df.loc[symbol, 'Close']
-                        
-                        # Calculate how much cash to allocate to this symbol
-                        cash_to_allocate = state.cash * allocation_per_symbol
-                        
-                        # Calculate shares to buy (round down to avoid insufficient funds)
-                        if price > 0:
-                            shares_to_buy = int(cash_to_allocate / price)
-                            
-                            if shares_to_buy > 0:
-                                orders.append(Order(
-                                    symbol=symbol,
-                                    quantity=shares_to_buy,
-                                    order_type="market",
-                                    timestamp=date
-                                ))
-            
+            if self.allocation_method == "equal_weight" and 'Close' in slice_df.columns:
+                allocation_per_symbol = 1.0 / len(slice_df.index)
+                cash_to_allocate = state.cash * allocation_per_symbol
+
+                # One vectorized pass over the close row instead of a
+                # per-symbol .loc lookup loop; int truncation rounds
+                # share counts down to avoid insufficient funds
+                symbols = slice_df.index.to_numpy()
+                prices = slice_df['Close'].to_numpy(dtype=np.float64)
+                valid = np.isfinite(prices) & (prices > 0)
+                shares = np.zeros(len(prices), dtype=np.int64)
+                shares[valid] = (cash_to_allocate / prices[valid]).astype(np.int64)
+
+                # Positional construction skips kwarg dispatch; field
+                # order is (symbol, quantity, order_type, timestamp)
+                for i in np.flatnonzero(shares > 0):
+                    orders.append(Order(symbols[i], int(shares[i]),
+                                        "market", date))
+
             self.initial_purchase_made = True
         
         # After initial purchase, hold (do nothing)
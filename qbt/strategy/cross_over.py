@@ -1,18 +1,25 @@
 from typing import List
 from datetime import datetime
+import numpy as np
 import pandas as pd
 from .base import Strategy
-from ..engine.state import Order, PortfolioState
+from ..engine.state import BarView, Order, PortfolioState
+from ..engine._kernels import crossover_decisions
 
 
 class CrossOverStrategy(Strategy):
     """
     Crossover strategy based on EMA signals.
-    
+
     Buy when short EMA crosses above long EMA.
     Sell when short EMA crosses below long EMA.
     """
-    
+
+    # Opt into the engine's BarView fast path: on_bar gets NumPy row
+    # arrays instead of a per-bar DataFrame (benchmark walks still pass
+    # frames, which on_bar dispatches to the legacy path)
+    accepts_bar_view = True
+
     def __init__(
         self,
         position_size: float = 0.2,
@@ -20,7 +27,7 @@ class CrossOverStrategy(Strategy):
     ):
         """
         Initialize CrossOver strategy.
-        
+
         Args:
             position_size: Fraction of portfolio to allocate per position (0.0 to 1.0)
             signal_column: Column name for the signal to follow
@@ -28,7 +35,13 @@ class CrossOverStrategy(Strategy):
         self.position_size = position_size
         self.signal_column = signal_column
         self.previous_signals = {}
-    
+        # BarView path: previous signals as an int8 vector aligned to the
+        # view's symbol order (allocated on the first bar), so detecting
+        # crossovers is one vectorized compare instead of a dict lookup
+        # per symbol. The dict above serves the legacy frame path only;
+        # an instance is always driven by one loop style.
+        self._prev_signals = None
+
     def on_bar(
         self,
         date: datetime,
@@ -37,61 +50,171 @@ class CrossOverStrategy(Strategy):
     ) -> List[Order]:
         """
         Generate orders based on crossover signals.
-        
+
         Args:
             date: Current date
-            slice_df: Market data for current date (all symbols)
+            slice_df: Market data for current date (all symbols); a
+                BarView when running under the engine's array fast path
             state: Current portfolio state
-            
+
         Returns:
             List of orders to execute
         """
+        if isinstance(slice_df, BarView):
+            return self._on_bar_view(slice_df, state)
+
         orders = []
-        
+
         if slice_df.empty or self.signal_column not in slice_df.columns:
             return orders
-        
-        # Calculate current portfolio equity
-        current_prices = slice_df['Close'].to_dict() if 'Close' in slice_df.columns else {}
-        total_equity = state.get_total_equity(current_prices)
-        
-        for symbol in slice_df.index:
-            if pd.isna(slice_df.loc[symbol, self.signal_column]):
+
+        # Positional row arrays instead of a symbol -> price dict built
+        # and hashed every bar
+        signals = slice_df[self.signal_column].to_numpy()
+        prices = slice_df['Close'].to_numpy() if 'Close' in slice_df.columns else None
+
+        # Calculate current portfolio equity; only held symbols ever
+        # contribute, so price just those
+        if state.positions and prices is not None:
+            positions = state.positions
+            position_prices = {
+                symbol: prices[i]
+                for i, symbol in enumerate(slice_df.index)
+                if symbol in positions
+            }
+            total_equity = state.get_total_equity(position_prices)
+        else:
+            total_equity = state.cash
+
+        for i, symbol in enumerate(slice_df.index):
+            current_signal = signals[i]
+            if pd.isna(current_signal):
                 continue
-                
-            current_signal = slice_df.loc[symbol, self.signal_column]
+
             previous_signal = self.previous_signals.get(symbol, 0)
-            
+
             # Check for signal changes
             signal_changed = current_signal != previous_signal
-            
+
             if signal_changed:
                 current_position = state.get_position(symbol)
-                current_price = current_prices.get(symbol, 0)
-                
+                current_price = prices[i] if prices is not None else 0
+
                 if current_price <= 0:
                     continue
-                
+
                 # Buy signal: short EMA crossed above long EMA
                 if current_signal == 1 and previous_signal == 0:
                     if current_position <= 0:  # Not currently long
                         # Close any short position first
                         if current_position < 0:
-                            orders.append(Order(symbol, -current_position, timestamp=date))
-                        
+                            orders.append(Order(symbol, -current_position, "market", date))
+
                         # Calculate position size
                         position_value = total_equity * self.position_size
                         shares_to_buy = int(position_value / current_price)
-                        
+
                         if shares_to_buy > 0 and position_value <= state.cash:
-                            orders.append(Order(symbol, shares_to_buy, timestamp=date))
-                
+                            orders.append(Order(symbol, shares_to_buy, "market", date))
+
                 # Sell signal: short EMA crossed below long EMA
                 elif current_signal == 0 and previous_signal == 1:
                     if current_position > 0:  # Currently long
-                        orders.append(Order(symbol, -current_position, timestamp=date))
-            
+                        orders.append(Order(symbol, -current_position, "market", date))
+
             # Update previous signal
             self.previous_signals[symbol] = current_signal
-        
-        return orders
\ No newline at end of file
+
+        return orders
+
+    def _on_bar_view(self, bar: BarView, state: PortfolioState) -> List[Order]:
+        """Array fast path: same decisions as on_bar, zero label lookups.
+
+        Rows of the precomputed wide matrices are scanned positionally —
+        no per-symbol .loc hashing and no price dict. Symbols with no
+        data today carry NaN in the signal row and are skipped, exactly
+        like their rows being absent from the per-bar frame.
+        """
+        orders: List[Order] = []
+
+        sig_row = bar.get(self.signal_column)
+        if sig_row is None:
+            return orders
+        px_row = bar.get('Close')
+        date = bar.date
+
+        symbol_index = state.symbol_index
+        if symbol_index is None:
+            symbol_index = {symbol: j for j, symbol in enumerate(bar.symbols)}
+
+        # Portfolio equity as one vectorized pass over the bound
+        # universe; falls back to pricing just the held symbols when the
+        # state has no dense position vector
+        if not state.positions or px_row is None:
+            total_equity = state.cash
+        elif state.qty_vec is not None:
+            total_equity = state.get_total_equity_row(px_row)
+        else:
+            position_prices = {}
+            for symbol in state.positions:
+                j = symbol_index.get(symbol)
+                if j is not None:
+                    price = px_row[j]
+                    if price == price:
+                        position_prices[symbol] = price
+            total_equity = state.get_total_equity(position_prices)
+
+        prev = self._prev_signals
+        if prev is None or len(prev) != len(bar.symbols):
+            prev = self._prev_signals = np.zeros(len(bar.symbols),
+                                                 dtype=np.int8)
+
+        # Vectorized crossover detection: today's signals where present
+        # (NaN = no bar today, which keeps yesterday's value), then one
+        # compare against the previous vector
+        if sig_row.dtype.kind == 'f':
+            valid = ~np.isnan(sig_row)
+            valid &= bar.tradable
+        else:
+            valid = bar.tradable
+        curr = prev.copy()
+        curr[valid] = sig_row[valid].astype(np.int8)
+
+        symbols = bar.symbols
+        changed = np.flatnonzero(curr != prev)
+        if changed.size:
+            if px_row is None:
+                # No prices at all: nothing can trade and no signal may
+                # advance, matching the frame path's behavior
+                curr[changed] = prev[changed]
+            else:
+                if state.qty_vec is not None:
+                    positions = state.qty_vec
+                else:
+                    positions = np.zeros(len(symbols), dtype=np.float64)
+                    for held, quantity in state.positions.items():
+                        idx = symbol_index.get(held)
+                        if idx is not None:
+                            positions[idx] = quantity
+
+                # All numeric decisions run in the compiled kernel; only
+                # the accepted results become Order objects
+                close_qty, trade_qty, valid = crossover_decisions(
+                    changed, prev, curr, px_row, positions,
+                    float(state.cash), total_equity, self.position_size
+                )
+                for k, j in enumerate(changed):
+                    if not valid[k]:
+                        # No valid price: keep the previous signal,
+                        # matching the frame path's behavior
+                        curr[j] = prev[j]
+                        continue
+                    if close_qty[k]:  # close a short before entering
+                        orders.append(Order(symbols[j], int(close_qty[k]),
+                                            "market", date))
+                    if trade_qty[k]:
+                        orders.append(Order(symbols[j], int(trade_qty[k]),
+                                            "market", date))
+
+        self._prev_signals = curr
+        return orders
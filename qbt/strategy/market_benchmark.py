@@ -1,9 +1,22 @@
 from typing import List
 from datetime import datetime
+import numpy as np
 import pandas as pd
 from .base import Strategy
 from ..engine.state import Order, PortfolioState
 
+# Benchmark type -> ETF proxy symbol, shared by every instance instead of
+# being rebuilt per construction
+_BENCHMARK_SYMBOLS = {
+    "SP500": "SPY",
+    "NASDAQ100": "QQQ",
+    "RUSSELL2000": "IWM",
+    "TOTAL_MARKET": "VTI",
+    "DOW": "DIA",
+    "EMERGING_MARKETS": "EEM",
+    "INTERNATIONAL": "EFA"
+}
+
 
 class MarketBenchmarkStrategy(Strategy):
     """
@@ -30,17 +43,7 @@ class MarketBenchmarkStrategy(Strategy):
         
     def _get_benchmark_symbol(self) -> str:
         """Get the ETF symbol for the benchmark type."""
-        benchmark_symbols = {
-            "SP500": "SPY",
-            "NASDAQ100": "QQQ", 
-            "RUSSELL2000": "IWM",
-            "TOTAL_MARKET": "VTI",
-            "DOW": "DIA",
-            "EMERGING_MARKETS": "EEM",
-            "INTERNATIONAL": "EFA"
-        }
-        
-        return benchmark_symbols.get(self.benchmark_type, "SPY")
+        return _BENCHMARK_SYMBOLS.get(self.benchmark_type, "SPY")
     
     def on_bar(
         self,
@@ -66,22 +69,23 @@ class MarketBenchmarkStrategy(Strategy):
         
         # Only buy on the first trading day
         if not self.initial_purchase_made:
-            # Check if our benchmark symbol is in the current data
-            if self.benchmark_symbol in slice_df.index:
-                if 'Close' in slice_df.columns and not pd.isna(slice_df.loc[self.benchmark_symbol, 'Close']):
-                    price = slice_df.loc[self.benchmark_symbol, 'Close']
-                    
-                    if price > 0:
-                        # Buy as many shares as possible with available cash
-                        shares_to_buy = int(state.cash / price)
-                        
-                        if shares_to_buy > 0:
-                            orders.append(Order(
-                                symbol=self.benchmark_symbol,
-                                quantity=shares_to_buy,
-                                order_type="market",
-                                timestamp=date
-                            ))
+            # Check if our benchmark symbol is in the current data; one
+            # positional lookup into the close row instead of repeated
+            # label-based .loc indexing
+            if 'Close' in slice_df.columns:
+                pos = slice_df.index.get_indexer([self.benchmark_symbol])[0]
+                price = (
+                    slice_df['Close'].to_numpy(dtype=np.float64)[pos]
+                    if pos >= 0 else np.nan
+                )
+
+                if np.isfinite(price) and price > 0:
+                    # Buy as many shares as possible with available cash
+                    shares_to_buy = int(state.cash / price)
+
+                    if shares_to_buy > 0:
+                        orders.append(Order(self.benchmark_symbol,
+                                            shares_to_buy, "market", date))
             
             self.initial_purchase_made = True
         
@@ -127,19 +131,17 @@ def create_benchmark_strategy(benchmark_type: str) -> MarketBenchmarkStrategy:
     Returns:
         Appropriate benchmark strategy instance
     """
-    benchmark_type = benchmark_type.upper()
-    
-    if benchmark_type == "SP500":
-        return SP500BenchmarkStrategy()
-    elif benchmark_type == "NASDAQ100":
-        return NASDAQ100BenchmarkStrategy()
-    elif benchmark_type == "RUSSELL2000":
-        return Russell2000BenchmarkStrategy()
-    elif benchmark_type == "TOTAL_MARKET":
-        return TotalMarketBenchmarkStrategy()
-    else:
-        # Default to S&P 500
-        return SP500BenchmarkStrategy()
+    # Dict dispatch; unknown types default to S&P 500
+    cls = _BENCHMARK_CLASSES.get(benchmark_type.upper(), SP500BenchmarkStrategy)
+    return cls()
+
+
+_BENCHMARK_CLASSES = {
+    "SP500": SP500BenchmarkStrategy,
+    "NASDAQ100": NASDAQ100BenchmarkStrategy,
+    "RUSSELL2000": Russell2000BenchmarkStrategy,
+    "TOTAL_MARKET": TotalMarketBenchmarkStrategy
+}
 
 
 def get_benchmark_universe(benchmark_type: str, user_universe: List[str] = None) -> List[str]:
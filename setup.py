@@ -18,6 +18,12 @@ ai_requirements = [
     "scikit-learn>=1.1.0"
 ]
 
+# Performance requirements (optional, enables JIT-compiled kernels)
+perf_requirements = [
+    "numba>=0.56.0",
+    "tqdm>=4.60.0"
+]
+
 setup(
     name="qbt",
     version="0.1.0",
@@ -44,6 +50,7 @@ setup(
     install_requires=core_requirements,
     extras_require={
         "ai": ai_requirements,
+        "perf": perf_requirements,
         "dev": [
             "pytest>=6.0",
             "pytest-cov>=2.0",